@@ -90,6 +90,30 @@ class Animation(object):
             return alpha
         raise Exception("Invalid submobject mode")
 
+    def get_sub_alphas(self, alpha, num_submobjects):
+        """
+        Array of get_sub_alpha for every index at once
+        """
+        indices = np.arange(num_submobjects)
+        if type(self).get_sub_alpha is not Animation.get_sub_alpha:
+            return np.array([
+                self.get_sub_alpha(alpha, index, num_submobjects)
+                for index in indices
+            ])
+        if self.submobject_mode in ["lagged_start", "smoothed_lagged_start"]:
+            prop = indices / float(num_submobjects)
+            if self.submobject_mode == "smoothed_lagged_start":
+                prop = smooth(prop)
+            lf = self.lag_factor
+            return np.clip(lf * alpha - (lf - 1) * prop, 0, 1)
+        elif self.submobject_mode == "one_at_a_time":
+            lower = indices / float(num_submobjects)
+            upper = (indices + 1) / float(num_submobjects)
+            return np.clip((alpha - lower) / (upper - lower), 0, 1)
+        elif self.submobject_mode == "all_at_once":
+            return np.full(num_submobjects, alpha, dtype='float')
+        raise Exception("Invalid submobject mode")
+
     def filter_out(self, *filter_functions):
         self.filter_functions += filter_functions
         return self
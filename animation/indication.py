@@ -182,7 +182,7 @@ class WiggleOutThenIn(Animation):
         Animation.__init__(self, mobject, **kwargs)
 
     def update_submobject(self, submobject, starting_sumobject, alpha):
-        submobject.points[:, :] = starting_sumobject.points
+        submobject.points = starting_sumobject.points
         submobject.scale(
             interpolate(1, self.scale_value, there_and_back(alpha)),
             about_point=self.scale_about_point
@@ -8,6 +8,8 @@ from constants import *
 from animation.animation import Animation
 from mobject.mobject import Group
 from mobject.mobject import Mobject
+from mobject.types.vectorized_mobject import VMobject
+from utils.bezier import interpolate
 from utils.config_ops import digest_config
 from utils.iterables import adjacent_pairs
 from utils.paths import path_along_arc
@@ -18,6 +20,22 @@ from utils.rate_functions import squish_rate_func
 from utils.space_ops import complex_to_R3
 
 
+# What VMobject.interpolate_color sets, in the order packed by
+# Transform.get_interpolation_batch
+VMOBJECT_INTERPOLATED_RGBAS = [
+    "fill_rgbas",
+    "stroke_rgbas",
+    "background_stroke_rgbas",
+]
+VMOBJECT_INTERPOLATED_SCALARS = [
+    "stroke_width",
+    "background_stroke_width",
+    "sheen",
+]
+VMOBJECT_INTERPOLATED_ATTRIBUTES = VMOBJECT_INTERPOLATED_RGBAS + \
+    VMOBJECT_INTERPOLATED_SCALARS + ["sheen_direction"]
+
+
 class Transform(Animation):
     CONFIG = {
         "path_arc": 0,
@@ -25,6 +43,9 @@ class Transform(Animation):
         "path_func": None,
         "submobject_mode": "all_at_once",
         "replace_mobject_with_target_in_scene": False,
+        # Interpolate all VMobjects in the families at once,
+        # treating the starting and target mobjects as fixed
+        "batch_interpolation": True,
     }
 
     def __init__(self, mobject, target_mobject, **kwargs):
@@ -38,9 +59,14 @@ class Transform(Animation):
 
         Animation.__init__(self, mobject, **kwargs)
         self.name += "To" + str(target_mobject)
+        # Subclasses often adjust the starting or target mobjects
+        # after this, so the batch is packed on the next update
+        self.interpolation_batch = None
 
     def update_config(self, **kwargs):
         Animation.update_config(self, **kwargs)
+        if hasattr(self, "interpolation_batch"):
+            self.interpolation_batch = None
         if "path_arc" in kwargs:
             self.path_func = path_along_arc(
                 kwargs["path_arc"],
@@ -65,6 +91,145 @@ class Transform(Animation):
         submob.interpolate(start, end, alpha, self.path_func)
         return self
 
+    def update_mobject(self, alpha):
+        if not hasattr(self, "interpolation_batch"):
+            # Still within __init__
+            return Animation.update_mobject(self, alpha)
+        if self.interpolation_batch is None:
+            self.interpolation_batch = self.get_interpolation_batch()
+        if self.interpolation_batch is False:
+            return Animation.update_mobject(self, alpha)
+        batch = self.interpolation_batch
+        mobjects = batch["mobjects"]
+        sub_alphas = self.get_sub_alphas(alpha, len(mobjects))
+        uniform = (self.submobject_mode == "all_at_once")
+
+        def get_alphas(attr):
+            # One alpha per row of the packed arrays
+            if uniform:
+                return alpha
+            return np.repeat(sub_alphas, batch["counts"][attr])[:, np.newaxis]
+
+        new_arrays = dict()
+        for attr, ends in batch["ends"].items():
+            start_array = batch["start_arrays"][attr]
+            end_array = batch["end_arrays"][attr]
+            if attr == "points" and self.path_func is not straight_path:
+                # Other paths might not treat each point on its own
+                new_arrays[attr] = [
+                    self.path_func(
+                        start_array[start:end], end_array[start:end],
+                        sub_alpha,
+                    )
+                    for start, end, sub_alpha in zip(
+                        ends, ends[1:], sub_alphas
+                    )
+                ]
+                continue
+            array = interpolate(start_array, end_array, get_alphas(attr))
+            new_arrays[attr] = [
+                array[start:end]
+                for start, end in zip(ends, ends[1:])
+            ]
+        scalars = interpolate(
+            batch["start_scalars"], batch["end_scalars"],
+            alpha if uniform else sub_alphas[:, np.newaxis]
+        )
+        widths = scalars[:, :3].tolist()
+
+        for i, mob in enumerate(mobjects):
+            mob.points = new_arrays["points"][i]
+            if sub_alphas[i] == 1.0:
+                end_mob = batch["end_mobjects"][i]
+                for attr in VMOBJECT_INTERPOLATED_ATTRIBUTES:
+                    setattr(mob, attr, getattr(end_mob, attr))
+                continue
+            for attr in VMOBJECT_INTERPOLATED_RGBAS:
+                setattr(mob, attr, new_arrays[attr][i])
+            mob.stroke_width, mob.background_stroke_width, mob.sheen = \
+                widths[i]
+            mob.sheen_direction = scalars[i, 3:]
+        return self
+
+    def get_interpolation_batch(self):
+        """
+        When every family member being transformed is a VMobject
+        interpolated the usual way, pack the points, rgbas and other
+        interpolated values of the starting and target families into
+        contiguous arrays, so each frame takes a handful of array
+        operations rather than several per submobject.  Returns False
+        when that isn't the case.
+        """
+        if not self.batch_interpolation:
+            return False
+        if type(self).update_submobject is not Transform.update_submobject:
+            return False
+        if type(self).update is not Animation.update:
+            return False
+        families = self.all_families_zipped
+        if len(families) == 0:
+            return False
+        array_attrs = ["points"] + VMOBJECT_INTERPOLATED_RGBAS
+        start_arrays = dict([(attr, []) for attr in array_attrs])
+        end_arrays = dict([(attr, []) for attr in array_attrs])
+        for mob, start, end in families:
+            if not all([isinstance(m, VMobject) for m in (mob, start, end)]):
+                return False
+            if type(mob).interpolate is not Mobject.interpolate:
+                return False
+            if type(mob).interpolate_color is not VMobject.interpolate_color:
+                return False
+            for attr in array_attrs:
+                try:
+                    # Interpolation broadcasts the two, as when only
+                    # one of them has a single rgba
+                    start_array, end_array = np.broadcast_arrays(
+                        getattr(start, attr), getattr(end, attr)
+                    )
+                except ValueError:
+                    return False
+                start_arrays[attr].append(start_array)
+                end_arrays[attr].append(end_array)
+            for m in start, end:
+                for attr in VMOBJECT_INTERPOLATED_SCALARS:
+                    if np.shape(getattr(m, attr)) != ():
+                        return False
+                if np.shape(m.sheen_direction) != (3,):
+                    return False
+
+        mobjects, starts, ends = list(zip(*families))
+
+        def get_scalars(mobs):
+            return np.array([
+                [getattr(m, attr) for attr in VMOBJECT_INTERPOLATED_SCALARS] +
+                list(m.sheen_direction)
+                for m in mobs
+            ], dtype='float')
+
+        counts = dict([
+            (attr, [len(array) for array in start_arrays[attr]])
+            for attr in array_attrs
+        ])
+        return {
+            "mobjects": mobjects,
+            "end_mobjects": ends,
+            "start_arrays": dict([
+                (attr, np.concatenate(start_arrays[attr]))
+                for attr in array_attrs
+            ]),
+            "end_arrays": dict([
+                (attr, np.concatenate(end_arrays[attr]))
+                for attr in array_attrs
+            ]),
+            "counts": counts,
+            "ends": dict([
+                (attr, np.append(0, np.cumsum(counts[attr])))
+                for attr in array_attrs
+            ]),
+            "start_scalars": get_scalars(starts),
+            "end_scalars": get_scalars(ends),
+        }
+
     def clean_up(self, surrounding_scene=None):
         Animation.clean_up(self, surrounding_scene)
         if self.replace_mobject_with_target_in_scene and surrounding_scene is not None:
@@ -0,0 +1,302 @@
+#!/usr/bin/env python
+
+import argparse
+import json
+import os
+import subprocess as sp
+import sys
+import tempfile
+import time
+
+HELP_MESSAGE = """
+   Renders the scenes in benchmarks/workloads.py to a null frame sink,
+   each in a fresh process, and reports frames per second, peak memory
+   and the time spent in each stage of rendering.  The startup workload
+   instead times importing big_ol_pile_of_manim_imports and getting a
+   first frame out.  Run from the top of the repository:
+
+   python -m benchmarks.run_benchmarks [<workload> ...]
+   --quality <low|medium|high> camera resolution and frame rate, low by default
+   --output <file> write the results as json
+   --baseline <file> compare with results saved earlier, exiting with
+       status 1 if any workload got slower or bigger than the tolerance
+   --tolerance <fraction> allowed change before it counts, 0.1 by default
+   --startup_runs <n> times to run the startup workload, keeping the
+       fastest, 3 by default
+"""
+
+QUALITIES = ["low", "medium", "high"]
+STARTUP = "startup"
+# Only imported when a scene needs them, see utils/lazy_imports.py,
+# so any of these loaded by the startup workload is a regression
+LAZY_MODULES = ["cv2", "scipy", "PIL.Image"]
+# Which way is better for each measurement compared with a baseline
+METRIC_SIGNS = [
+    ("fps", 1),
+    ("peak_rss_mb", -1),
+    ("import_time", -1),
+    ("first_frame_time", -1),
+]
+
+
+def get_configuration():
+    parser = argparse.ArgumentParser(
+        description=HELP_MESSAGE,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("workloads", nargs="*")
+    parser.add_argument("--quality", default="low", choices=QUALITIES)
+    parser.add_argument("--output")
+    parser.add_argument("--baseline")
+    parser.add_argument("--tolerance", type=float, default=0.1)
+    parser.add_argument("--startup_runs", type=int, default=3)
+    # Used by the parent process to run one workload in a child
+    parser.add_argument("--run_workload", help=argparse.SUPPRESS)
+    parser.add_argument("--result_file", help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+def get_scene_kwargs(quality):
+    from constants import LOW_QUALITY_CAMERA_CONFIG
+    from constants import LOW_QUALITY_FRAME_DURATION
+    from constants import MEDIUM_QUALITY_CAMERA_CONFIG
+    from constants import MEDIUM_QUALITY_FRAME_DURATION
+    from constants import PRODUCTION_QUALITY_CAMERA_CONFIG
+    from constants import PRODUCTION_QUALITY_FRAME_DURATION
+    camera_config, frame_duration = {
+        "low": (LOW_QUALITY_CAMERA_CONFIG, LOW_QUALITY_FRAME_DURATION),
+        "medium": (MEDIUM_QUALITY_CAMERA_CONFIG, MEDIUM_QUALITY_FRAME_DURATION),
+        "high": (PRODUCTION_QUALITY_CAMERA_CONFIG, PRODUCTION_QUALITY_FRAME_DURATION),
+    }[quality]
+    return {
+        "camera_config": dict(camera_config),
+        "frame_duration": frame_duration,
+        "write_to_movie": True,
+        "encoder_preset": "null",
+    }
+
+
+def get_peak_rss_mb():
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        # Reported in bytes rather than kilobytes
+        peak /= 1024.
+    return peak / 1024.
+
+
+def run_startup(quality):
+    """
+    Must run in a fresh process, before anything from manim has
+    been imported
+    """
+    start_time = time.time()
+    import big_ol_pile_of_manim_imports
+    import_time = time.time() - start_time
+    lazy_modules_loaded = [
+        module for module in LAZY_MODULES
+        if module in sys.modules
+    ]
+    from benchmarks.workloads import SingleFrame
+    SingleFrame(**get_scene_kwargs(quality))
+    return {
+        "name": STARTUP,
+        "quality": quality,
+        "import_time": import_time,
+        "first_frame_time": time.time() - start_time,
+        "peak_rss_mb": get_peak_rss_mb(),
+        "lazy_modules_loaded": lazy_modules_loaded,
+    }
+
+
+def run_workload(name, quality):
+    """
+    Renders one workload in this process, returning its measurements.
+    Peak memory covers the whole process, so it is only meaningful
+    when nothing else has been rendered here.
+    """
+    from benchmarks.workloads import WORKLOADS
+    from utils.profiling import PROFILER
+
+    scene_class = WORKLOADS[name]
+    PROFILER.reset()
+    PROFILER.enable()
+    start_time = time.time()
+    scene = scene_class(**get_scene_kwargs(quality))
+    wall_time = time.time() - start_time
+    PROFILER.disable()
+
+    stage_times = dict()
+    for segment in PROFILER.segments:
+        for key, value in segment["totals"].items():
+            stage_times[key] = stage_times.get(key, 0) + value
+    render_time = sum([
+        PROFILER.get_segment_total_time(segment)
+        for segment in PROFILER.segments
+    ])
+    num_frames = scene.frame_sink.num_frames
+    return {
+        "name": name,
+        "quality": quality,
+        "num_frames": num_frames,
+        "wall_time": wall_time,
+        "render_time": render_time,
+        "fps": num_frames / render_time if render_time > 0 else 0,
+        "peak_rss_mb": get_peak_rss_mb(),
+        "stage_times": stage_times,
+    }
+
+
+def run_workload_in_subprocess(name, quality):
+    handle, result_file = tempfile.mkstemp(suffix=".json")
+    os.close(handle)
+    command = [
+        sys.executable, "-m", "benchmarks.run_benchmarks",
+        "--run_workload", name,
+        "--quality", quality,
+        "--result_file", result_file,
+    ]
+    try:
+        process = sp.run(command, stdout=sp.PIPE, stderr=sp.STDOUT)
+        if process.returncode != 0:
+            return {
+                "name": name,
+                "error": process.stdout.decode(errors="replace"),
+            }
+        with open(result_file) as fp:
+            return json.load(fp)
+    finally:
+        os.remove(result_file)
+
+
+def run_startup_in_subprocesses(quality, num_runs):
+    # Keeps the fastest of each time, as startup is short and noisy
+    best = None
+    for run in range(max(num_runs, 1)):
+        result = run_workload_in_subprocess(STARTUP, quality)
+        if "error" in result:
+            return result
+        if best is None:
+            best = result
+            continue
+        for key in ["import_time", "first_frame_time", "peak_rss_mb"]:
+            best[key] = min(best[key], result[key])
+    return best
+
+
+def print_results(results):
+    print("%-20s %8s %10s %10s %12s" % (
+        "workload", "frames", "fps", "wall (s)", "peak RSS (MB)"
+    ))
+    for result in results:
+        if "error" in result:
+            print("%-20s failed" % result["name"])
+            continue
+        if result["name"] == STARTUP:
+            print("%-20s import %.3fs, first frame %.3fs, %.1f MB" % (
+                STARTUP, result["import_time"],
+                result["first_frame_time"], result["peak_rss_mb"],
+            ))
+            if result["lazy_modules_loaded"]:
+                print("    loaded at startup: %s" % ", ".join(
+                    result["lazy_modules_loaded"]
+                ))
+            continue
+        print("%-20s %8d %10.2f %10.2f %12.1f" % (
+            result["name"], result["num_frames"], result["fps"],
+            result["wall_time"], result["peak_rss_mb"],
+        ))
+        stage_times = result["stage_times"]
+        top_stages = sorted(
+            [key for key in stage_times if ";" not in key],
+            key=lambda key: -stage_times[key]
+        )
+        for key in top_stages[:4]:
+            print("    %-30s %8.3fs" % (key, stage_times[key]))
+
+
+def compare_to_baseline(results, baseline, tolerance):
+    """
+    Returns lines describing how each workload compares with its
+    baseline, and whether any of them regressed
+    """
+    baseline_by_name = dict([
+        (result["name"], result)
+        for result in baseline
+        if "error" not in result
+    ])
+    lines = []
+    regressed = False
+    for result in results:
+        name = result["name"]
+        if "error" in result or name not in baseline_by_name:
+            continue
+        old = baseline_by_name[name]
+        if old.get("quality") != result.get("quality"):
+            lines.append("%s: baseline is at a different quality" % name)
+            continue
+        for key, sign in METRIC_SIGNS:
+            if key not in result or not old.get(key):
+                continue
+            change = (result[key] - old[key]) / old[key]
+            status = ""
+            if sign * change < -tolerance:
+                status = "  REGRESSION"
+                regressed = True
+            lines.append("%-20s %-12s %10.2f -> %10.2f (%+.1f%%)%s" % (
+                name, key, old[key], result[key], 100 * change, status
+            ))
+    return lines, regressed
+
+
+def main():
+    args = get_configuration()
+    if args.run_workload == STARTUP:
+        result = run_startup(args.quality)
+        with open(args.result_file, "w") as fp:
+            json.dump(result, fp)
+        return
+    if args.run_workload is not None:
+        result = run_workload(args.run_workload, args.quality)
+        with open(args.result_file, "w") as fp:
+            json.dump(result, fp)
+        return
+
+    from benchmarks.workloads import WORKLOADS
+    all_names = [STARTUP] + list(WORKLOADS.keys())
+    names = args.workloads or all_names
+    for name in names:
+        if name not in all_names:
+            raise Exception("Unknown workload %s, choose from %s" % (
+                name, ", ".join(all_names)
+            ))
+    results = []
+    for name in names:
+        print("Running %s..." % name)
+        if name == STARTUP:
+            result = run_startup_in_subprocesses(
+                args.quality, args.startup_runs
+            )
+        else:
+            result = run_workload_in_subprocess(name, args.quality)
+        if "error" in result:
+            print(result["error"])
+        results.append(result)
+    print_results(results)
+
+    if args.output:
+        with open(args.output, "w") as fp:
+            json.dump(results, fp, indent=2)
+    if args.baseline:
+        with open(args.baseline) as fp:
+            baseline = json.load(fp)
+        lines, regressed = compare_to_baseline(
+            results, baseline, args.tolerance
+        )
+        print("\n".join(lines))
+        if regressed:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
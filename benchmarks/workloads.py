@@ -0,0 +1,107 @@
+from collections import OrderedDict
+
+from big_ol_pile_of_manim_imports import *
+
+# Synthetic scenes, each leaning on one part of the renderer.  They
+# are meant to stay fixed, so that timings can be compared across
+# changes to the code rather than to the scenes.
+
+
+class LargeTexWrite(Scene):
+    def construct(self):
+        terms = [
+            "\\frac{x_{%d}^{%d}}{%d!}" % (n, n, n)
+            for n in range(1, 41)
+        ]
+        rows = VGroup(*[
+            TexMobject("+".join(terms[i:i + 10]))
+            for i in range(0, len(terms), 10)
+        ])
+        rows.arrange_submobjects(DOWN)
+        rows.set_width(FRAME_WIDTH - 1)
+        self.play(Write(rows), run_time=3)
+
+
+class NonlinearNumberPlane(Scene):
+    def construct(self):
+        plane = NumberPlane(
+            x_line_frequency=0.5,
+            y_line_frequency=0.5,
+        )
+        plane.prepare_for_nonlinear_transform(100)
+        self.add(plane)
+        self.play(ApplyPointwiseFunction(
+            lambda p: p + np.sin(p[1]) * RIGHT + np.sin(p[0]) * UP,
+            plane,
+            run_time=3,
+        ))
+
+
+class RotatingSurface(ThreeDScene):
+    def construct(self):
+        self.set_camera_orientation(phi=70 * DEGREES, theta=-45 * DEGREES)
+        surface = ParametricSurface(
+            lambda u, v: 2 * np.array([
+                np.cos(u) * np.sin(v),
+                np.sin(u) * np.sin(v),
+                np.cos(v),
+            ]),
+            u_max=TAU,
+            v_max=PI,
+            resolution=(24, 12),
+        )
+        self.add(surface)
+        self.play(Rotate(surface, PI / 2, axis=OUT), run_time=3)
+
+
+class PointCloudField(Scene):
+    def construct(self):
+        points = np.random.uniform(-4, 4, (20000, 3))
+        points[:, 2] = 0
+        rgbas = np.ones((len(points), 4))
+        rgbas[:, :3] = np.random.uniform(0, 1, (len(points), 3))
+        cloud = PMobject().add_points(points, rgbas=rgbas)
+        self.add(cloud)
+        self.play(Rotate(cloud, PI / 2), run_time=3)
+
+
+class ImageZoom(Scene):
+    def construct(self):
+        pixels = np.random.randint(0, 256, (256, 256, 3)).astype('uint8')
+        image = ImageMobject(pixels)
+        image.set_height(2)
+        self.add(image)
+        self.play(ApplyMethod(image.scale, 3), run_time=1.5)
+        self.play(ApplyMethod(image.scale, 1. / 3), run_time=1.5)
+
+
+class UpdaterHeavyWait(Scene):
+    def construct(self):
+        dots = VGroup()
+        for n in range(300):
+            dot = Dot(radius=0.05)
+            dot.move_to((1 + n % 10 * 0.3) * RIGHT)
+            dot.rate = (1 + n % 7) * 0.2
+            dot.add_updater(
+                lambda m, dt: m.rotate(m.rate * dt, about_point=ORIGIN)
+            )
+            dots.add(dot)
+        self.add(dots)
+        self.wait(3)
+
+
+# Used to time startup, so as little as possible happens after import
+class SingleFrame(Scene):
+    def construct(self):
+        self.add(Square())
+        self.wait(self.frame_duration)
+
+
+WORKLOADS = OrderedDict([
+    ("tex_write", LargeTexWrite),
+    ("nonlinear_plane", NonlinearNumberPlane),
+    ("surface_rotation", RotatingSurface),
+    ("point_cloud_field", PointCloudField),
+    ("image_zoom", ImageZoom),
+    ("updater_wait", UpdaterHeavyWait),
+])
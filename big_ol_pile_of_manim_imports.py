@@ -88,6 +88,7 @@ from utils.color import *
 from utils.config_ops import *
 from utils.images import *
 from utils.iterables import *
+from utils.lazy_imports import *
 from utils.output_directory_getters import *
 from utils.paths import *
 from utils.rate_functions import *
@@ -109,5 +110,6 @@ import string
 import sys
 import math
 
-from PIL import Image
 from colour import Color
+
+Image = lazy_import("PIL.Image")
@@ -4,9 +4,8 @@ import numpy as np
 import operator as op
 
 import time
+import weakref
 
-from PIL import Image
-from scipy.spatial.distance import pdist
 import cairo
 
 from constants import *
@@ -17,15 +16,52 @@ from mobject.types.vectorized_mobject import VMobject
 from utils.color import color_to_int_rgba
 from utils.color import rgb_to_hex
 from utils.config_ops import digest_config
-from utils.images import get_full_raster_image_path
+from utils.images import get_raster_image_array
 from utils.iterables import batch_by_property
 from utils.iterables import list_difference_update
 from utils.iterables import remove_list_redundancies
+from utils.lazy_imports import lazy_import
+from utils.profiling import PROFILER
 from utils.simple_functions import fdiv
 from utils.space_ops import angle_of_vector
 from utils.space_ops import get_norm
 from functools import reduce
 
+Image = lazy_import("PIL.Image")
+
+# The last pixels resampled for each image mobject, along with what
+# they were resampled from, kept outside of the mobjects so copies
+# and hashes of them don't include these
+RESAMPLED_IMAGE_PIXELS = weakref.WeakKeyDictionary()
+
+
+class Identity(object):
+    """
+    Equal only to an Identity of the very same object, which it keeps
+    alive so that the object's id can't be reused
+    """
+
+    def __init__(self, obj):
+        self.obj = obj
+
+    def __eq__(self, other):
+        return isinstance(other, Identity) and other.obj is self.obj
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return id(self.obj)
+
+
+def is_frozen_array(array):
+    # Read-only, and not a view of anything writeable
+    while isinstance(array, np.ndarray):
+        if array.flags.writeable:
+            return False
+        array = array.base
+    return True
+
 
 class Camera(object):
     CONFIG = {
@@ -49,12 +85,17 @@ class Camera(object):
         # round z coordinate to nearest hundredth when comparring
         "z_buff_func": lambda m: np.round(m.get_center()[2], 2),
         "cairo_line_width_multiple": 0.01,
+        # When drawing a full frame, keep a copy of the pixels for
+        # the mobjects at the bottom which haven't changed, and only
+        # draw what comes after them on the next frame
+        "use_static_layer_cache": True,
     }
 
     def __init__(self, background=None, **kwargs):
         digest_config(self, kwargs, locals())
         self.rgb_max_val = np.iinfo(self.pixel_array_dtype).max
         self.pixel_array_to_cairo_context = {}
+        self.clear_static_layer()
         self.init_background()
         self.resize_frame_shape()
         self.reset()
@@ -120,11 +161,12 @@ class Camera(object):
         height = self.get_pixel_height()
         width = self.get_pixel_width()
         if self.background_image is not None:
-            path = get_full_raster_image_path(self.background_image)
-            image = Image.open(path).convert(self.image_mode)
+            image_array = get_raster_image_array(
+                self.background_image, self.image_mode
+            )
             # TODO, how to gracefully handle backgrounds
             # with different sizes?
-            self.background = np.array(image)[:height, :width]
+            self.background = image_array[:height, :width]
             self.background = self.background.astype(self.pixel_array_dtype)
         else:
             background_rgba = color_to_int_rgba(
@@ -244,6 +286,10 @@ class Camera(object):
         return self.capture_mobjects([mobject], **kwargs)
 
     def capture_mobjects(self, mobjects, **kwargs):
+        with PROFILER.stage("capture_mobjects"):
+            self.capture_mobjects_in_batches(mobjects, **kwargs)
+
+    def capture_mobjects_in_batches(self, mobjects, **kwargs):
         mobjects = self.get_mobjects_to_display(mobjects, **kwargs)
 
         # Organize this list into batches of the same type, and
@@ -269,7 +315,130 @@ class Camera(object):
             # check what the type is, and call the appropriate function
             for mobject_type, func in type_func_pairs:
                 if batch_type == mobject_type:
-                    func(batch, self.pixel_array)
+                    with PROFILER.stage(mobject_type.__name__):
+                        func(batch, self.pixel_array)
+
+    def capture_mobjects_over_static_layer(self, mobjects, **kwargs):
+        """
+        Draws the mobjects over the background, as with reset followed
+        by capture_mobjects, but starts from a cached image of those
+        mobjects at the bottom which are unchanged since the last call.
+        """
+        if not self.use_static_layer_cache:
+            self.reset()
+            self.capture_mobjects(mobjects, **kwargs)
+            return
+        layer = self.static_layer
+        mobjects = self.get_mobjects_to_display(mobjects, **kwargs)
+        fingerprints = [
+            self.get_mobject_display_fingerprint(mob)
+            for mob in mobjects
+        ]
+        camera_fingerprint = self.get_static_layer_camera_fingerprint()
+        num_unchanged = 0
+        if camera_fingerprint == layer["camera_fingerprint"]:
+            for fp1, fp2 in zip(fingerprints, layer["last_fingerprints"]):
+                if fp1 != fp2:
+                    break
+                num_unchanged += 1
+        # Background colored vmobjects are drawn a batch at a time, so
+        # don't split a batch between the layer and what's drawn over it
+        while 0 < num_unchanged < len(mobjects):
+            file_names = [
+                mob.get_background_image_file()
+                if isinstance(mob, VMobject) else None
+                for mob in mobjects[num_unchanged - 1:num_unchanged + 1]
+            ]
+            if file_names[0] is None or file_names[0] != file_names[1]:
+                break
+            num_unchanged -= 1
+
+        if 0 < layer["size"] <= num_unchanged:
+            self.set_pixel_array(layer["pixel_array"])
+            start = layer["size"]
+        else:
+            self.reset()
+            start = 0
+        if num_unchanged > start:
+            self.capture_mobjects(
+                mobjects[start:num_unchanged],
+                include_submobjects=False,
+            )
+            layer["pixel_array"] = np.array(self.pixel_array)
+            layer["size"] = num_unchanged
+        elif start == 0:
+            layer["pixel_array"] = None
+            layer["size"] = 0
+        self.capture_mobjects(
+            mobjects[num_unchanged:],
+            include_submobjects=False,
+        )
+        layer["last_fingerprints"] = fingerprints
+        layer["camera_fingerprint"] = camera_fingerprint
+
+    def clear_static_layer(self):
+        self.static_layer = {
+            "pixel_array": None,
+            # Number of mobjects drawn into pixel_array
+            "size": 0,
+            "last_fingerprints": [],
+            "camera_fingerprint": None,
+        }
+
+    def get_mobject_display_fingerprint(self, mobject):
+        # Points, colors, stroke widths and so on all live as arrays
+        # or plain values among the mobject's attributes
+        result = [Identity(mobject)]
+        for key, value in mobject.__dict__.items():
+            if isinstance(value, np.ndarray):
+                result.append((key, self.get_array_fingerprint(value)))
+            elif isinstance(value, (int, float, str, type(None))):
+                result.append((key, value))
+        if isinstance(mobject, VMobject):
+            # Subpaths aren't among the mobjects displayed, but are
+            # drawn as part of their parent
+            result += [
+                self.get_mobject_display_fingerprint(subpath)
+                for subpath in mobject.get_subpath_mobjects()
+            ]
+        if isinstance(mobject, AbstractImageMobject):
+            if mobject.cache_resampled_pixels:
+                result.append(mobject.get_pixel_array_version())
+            else:
+                # Its pixels may change in place without notice, so
+                # it never counts as unchanged
+                result.append(Identity(object()))
+        return tuple(result)
+
+    def get_array_fingerprint(self, array):
+        # Arrays which can't be changed in place, like the points of
+        # a mobject, are compared by identity rather than content
+        if is_frozen_array(array):
+            return Identity(array)
+        return (array.shape, hash(array.tobytes()))
+
+    def get_static_layer_camera_fingerprint(self):
+        # Includes mobjects held by the camera, like the frame of
+        # a MovingCamera or the angle trackers of a ThreeDCamera
+        result = [
+            id(self.background),
+            self.background.shape,
+            id(self.pixel_array),
+            self.pixel_array.shape,
+        ]
+        for key, value in self.__dict__.items():
+            if isinstance(value, Mobject):
+                result.append(tuple(
+                    self.get_mobject_display_fingerprint(mob)
+                    for mob in value.get_family()
+                ))
+            elif isinstance(value, np.ndarray):
+                if value is self.background or value is self.pixel_array:
+                    continue
+                result.append((key, self.get_array_fingerprint(value)))
+            elif isinstance(value, (int, float, str, type(None))):
+                result.append((key, value))
+        return tuple(result)
 
     # Methods associated with svg rendering
 
@@ -329,26 +498,37 @@ class Camera(object):
             # Subpath vectorized mobjects are taken care
             # of by their parent
             return
-        self.set_cairo_context_path(ctx, vmobject)
-        self.apply_stroke(ctx, vmobject, background=True)
-        self.apply_fill(ctx, vmobject)
-        self.apply_stroke(ctx, vmobject)
+        with PROFILER.stage("path"):
+            self.set_cairo_context_path(ctx, vmobject)
+        with PROFILER.stage("stroke"):
+            self.apply_stroke(ctx, vmobject, background=True)
+        with PROFILER.stage("fill"):
+            self.apply_fill(ctx, vmobject)
+        with PROFILER.stage("stroke"):
+            self.apply_stroke(ctx, vmobject)
         return self
 
     def set_cairo_context_path(self, ctx, vmobject):
         ctx.new_path()
+        # Pycairo can't take a path as one buffer, so the coordinates
+        # for each curve are laid out by numpy ahead of time, leaving
+        # nothing but the cairo calls themselves in the python loop
+        move_to = ctx.move_to
+        curve_to = ctx.curve_to
         for vmob in it.chain([vmobject], vmobject.get_subpath_mobjects()):
             points = self.transform_points_pre_display(
                 vmob, vmob.points
             )
-            if np.any(np.isnan(points)) or np.any(points == np.inf):
+            if not np.all(np.isfinite(points)):
                 points = np.zeros((1, 3))
+            num_curves = (len(points) - 1) // 3
+            curves = points[1:3 * num_curves + 1, :2].reshape(
+                (num_curves, 6)
+            ).tolist()
             ctx.new_sub_path()
-            ctx.move_to(*points[0][:2])
-            for triplet in zip(points[1::3], points[2::3], points[3::3]):
-                ctx.curve_to(*it.chain(*[
-                    point[:2] for point in triplet
-                ]))
+            move_to(*points[0, :2].tolist())
+            for curve in curves:
+                curve_to(*curve)
             if vmob.is_closed():
                 ctx.close_path()
         return self
@@ -436,104 +616,281 @@ class Camera(object):
         pixel_coords = self.points_to_pixel_coords(
             pmobject, points
         )
-        pixel_coords = self.thickened_coordinates(
+        pixel_indices, point_indices = self.get_point_splat_indices(
             pixel_coords, thickness
         )
-        rgba_len = pixel_array.shape[2]
+        if len(pixel_indices) == 0:
+            return
+        self.splat_rgbas(pixel_array, pixel_indices, point_indices, rgbas)
 
-        rgbas = (self.rgb_max_val * rgbas).astype(self.pixel_array_dtype)
-        target_len = len(pixel_coords)
-        factor = target_len // len(rgbas)
-        rgbas = np.array([rgbas] * factor).reshape((target_len, rgba_len))
+    def get_point_splat_indices(self, pixel_coords, thickness):
+        """
+        Every point covers a thickness by thickness square of pixels.
+        Returns the flat index of each on screen pixel covered, along
+        with the index of the point covering it.
+        """
+        nudges = self.get_thickening_nudges(thickness)
+        xs = pixel_coords[:, 0:1] + nudges[:, 0]
+        ys = pixel_coords[:, 1:2] + nudges[:, 1]
+        on_screen = (xs >= 0) & (ys >= 0)
+        on_screen &= xs < self.get_pixel_width()
+        on_screen &= ys < self.get_pixel_height()
+        point_indices = np.nonzero(on_screen)[0]
+        pixel_indices = (ys * self.get_pixel_width() + xs)[on_screen]
+        return pixel_indices, point_indices
+
+    def splat_rgbas(self, pixel_array, pixel_indices, point_indices, rgbas):
+        """
+        Composites the rgbas of points, with values between 0 and 1,
+        over the pixels of pixel_array they cover, given as the flat
+        index of each pixel along with the index of its point.
+
+        Opaque points simply cover what's below them, later ones
+        covering earlier ones.  Where translucent points overlap,
+        their combined opacity comes from summing the logs of what
+        each lets through, and their color is the average of theirs
+        weighted by opacity.  Unlike compositing them one at a time,
+        that doesn't depend on their order, which lets every pixel
+        be worked out at once, with bincount.
+        """
+        num_frame_pixels = self.get_pixel_height() * self.get_pixel_width()
+        flat_pixel_array = pixel_array.reshape((num_frame_pixels, -1))
+        rgbas = np.clip(rgbas, 0, 1)
+        single_color = np.all(rgbas == rgbas[0])
+        if single_color:
+            rgbas = rgbas[0]
+        if np.all(rgbas[..., 3] == 1):
+            colors = np.round(self.rgb_max_val * rgbas)
+            colors = colors.astype(self.pixel_array_dtype)
+            if single_color:
+                flat_pixel_array[pixel_indices] = colors
+            else:
+                flat_pixel_array[pixel_indices] = colors[point_indices]
+            self.copy_back_flat_pixel_array(pixel_array, flat_pixel_array)
+            return
 
-        on_screen_indices = self.on_screen_pixels(pixel_coords)
-        pixel_coords = pixel_coords[on_screen_indices]
-        rgbas = rgbas[on_screen_indices]
+        if 4 * len(pixel_indices) > num_frame_pixels:
+            # With this many splats, bins for every pixel of the
+            # frame cost less than sorting to find those covered
+            counts = np.bincount(pixel_indices, minlength=num_frame_pixels)
+            pixels = np.flatnonzero(counts)
+            counts = counts[pixels]
+            bins = pixel_indices
+            num_bins = num_frame_pixels
+        else:
+            pixels, bins, counts = np.unique(
+                pixel_indices, return_inverse=True, return_counts=True
+            )
+            num_bins = len(pixels)
 
-        ph = self.get_pixel_height()
-        pw = self.get_pixel_width()
+        def sum_by_pixel(point_values):
+            result = np.bincount(bins, point_values[point_indices], num_bins)
+            if num_bins != len(pixels):
+                result = result[pixels]
+            return result
 
-        flattener = np.array([1, pw], dtype='int')
-        flattener = flattener.reshape((2, 1))
-        indices = np.dot(pixel_coords, flattener)[:, 0]
-        indices = indices.astype('int')
+        if single_color:
+            transmittance = (1 - rgbas[3])**counts
+            src_rgbs = np.outer(1 - transmittance, rgbas[:3])
+        else:
+            alphas = rgbas[:, 3]
+            with np.errstate(divide="ignore"):
+                transmittance = np.exp(sum_by_pixel(np.log(1 - alphas)))
+            alpha_sums = sum_by_pixel(alphas)
+            alpha_sums[alpha_sums == 0] = 1
+            src_rgbs = np.array([
+                sum_by_pixel(alphas * rgbas[:, i])
+                for i in range(3)
+            ]).T
+            src_rgbs *= ((1 - transmittance) / alpha_sums).reshape((-1, 1))
+
+        result = np.zeros((len(pixels), flat_pixel_array.shape[1]))
+        dest = flat_pixel_array[pixels] / self.rgb_max_val
+        dest_alphas = dest[:, 3] * transmittance
+        result[:, 3] = 1 - transmittance + dest_alphas
+        result[:, :3] = src_rgbs + dest[:, :3] * dest_alphas.reshape((-1, 1))
+        result[:, :3] /= np.maximum(result[:, 3:], 1e-12)
+        flat_pixel_array[pixels] = np.round(
+            self.rgb_max_val * np.clip(result, 0, 1)
+        )
+        self.copy_back_flat_pixel_array(pixel_array, flat_pixel_array)
 
-        new_pa = pixel_array.reshape((ph * pw, rgba_len))
-        new_pa[indices] = rgbas
-        pixel_array[:, :] = new_pa.reshape((ph, pw, rgba_len))
+    def copy_back_flat_pixel_array(self, pixel_array, flat_pixel_array):
+        # Only needed when reshaping pixel_array had to copy it
+        if not np.shares_memory(flat_pixel_array, pixel_array):
+            pixel_array[:, :] = flat_pixel_array.reshape(pixel_array.shape)
 
     def display_multiple_image_mobjects(self, image_mobjects, pixel_array):
         for image_mobject in image_mobjects:
             self.display_image_mobject(image_mobject, pixel_array)
 
     def display_image_mobject(self, image_mobject, pixel_array):
-        corner_coords = self.points_to_pixel_coords(
+        corner_coords = self.points_to_subpixel_coords(
             image_mobject, image_mobject.points
         )
-        ul_coords, ur_coords, dl_coords = corner_coords
-        right_vect = ur_coords - ul_coords
-        down_vect = dl_coords - ul_coords
-        center_coords = ul_coords + (right_vect + down_vect) / 2
-
-        sub_image = Image.fromarray(
-            image_mobject.get_pixel_array(),
-            mode="RGBA"
-        )
-
-        # Reshape
-        pixel_width = max(int(pdist([ul_coords, ur_coords])), 1)
-        pixel_height = max(int(pdist([ul_coords, dl_coords])), 1)
-        sub_image = sub_image.resize(
-            (pixel_width, pixel_height), resample=Image.BICUBIC
+        region = self.get_image_mobject_region(corner_coords)
+        if region is None:
+            return
+        resampled_pixels = self.get_resampled_image_mobject_pixels(
+            image_mobject, corner_coords, region
         )
+        if resampled_pixels is None:
+            return
+        # Paint on top of existing pixel array
+        self.overlay_rgba_array(pixel_array, resampled_pixels, region[:2])
 
-        # Rotate
-        angle = angle_of_vector(right_vect)
-        adjusted_angle = -int(360 * angle / TAU)
-        if adjusted_angle != 0:
-            sub_image = sub_image.rotate(
-                adjusted_angle, resample=Image.BICUBIC, expand=1
-            )
+    def get_image_mobject_region(self, corner_coords):
+        """
+        Returns the (left, top, right, bottom) bounds of the pixels
+        covered by the parallelogram with corners ul, ur and dl at
+        corner_coords, cut down to the frame, or None if it's off
+        screen.
+        """
+        ul_coords, ur_coords, dl_coords = corner_coords
+        corners = np.array([
+            ul_coords, ur_coords, dl_coords,
+            ur_coords + dl_coords - ul_coords,
+        ])
+        left, top = np.floor(corners.min(0)).astype(int)
+        right, bottom = np.ceil(corners.max(0)).astype(int)
+        left = max(left, 0)
+        top = max(top, 0)
+        right = min(right, self.get_pixel_width())
+        bottom = min(bottom, self.get_pixel_height())
+        if left >= right or top >= bottom:
+            return None
+        return (left, top, right, bottom)
+
+    def get_resampled_image_mobject_pixels(self, image_mobject,
+                                           corner_coords, region):
+        """
+        Maps the pixels of image_mobject with a single affine
+        transform, taking the corners of its pixel array to
+        corner_coords, which also accounts for any shear, and only
+        resampling the part within region.
 
-        # TODO, there is no accounting for a shear...
+        Images shown smaller than their pixel arrays are sampled from
+        a level of their mipmap close to the size shown.
 
-        # Paste into an image as large as the camear's pixel array
-        full_image = Image.fromarray(
-            np.zeros((self.get_pixel_height(), self.get_pixel_width())),
-            mode="RGBA"
+        Unless the mobject's cache_resampled_pixels is turned off,
+        the result is kept and reused for as long as the mobject's
+        corners, the region and its pixel array stay the same.
+        """
+        ul_coords, ur_coords, dl_coords = corner_coords
+        height, width = image_mobject.get_pixel_array().shape[:2]
+        scale = min(
+            width / max(get_norm(ur_coords - ul_coords), 1),
+            height / max(get_norm(dl_coords - ul_coords), 1),
+        )
+        source = image_mobject.get_pixel_array_for_scale(scale)
+        key = (
+            tuple(corner_coords.flatten()), region,
+            image_mobject.get_pixel_array_version(),
         )
-        new_ul_coords = center_coords - np.array(sub_image.size) / 2
-        new_ul_coords = new_ul_coords.astype(int)
-        full_image.paste(
-            sub_image,
-            box=(
-                new_ul_coords[0],
-                new_ul_coords[1],
-                new_ul_coords[0] + sub_image.size[0],
-                new_ul_coords[1] + sub_image.size[1],
+        use_cache = image_mobject.cache_resampled_pixels
+        if use_cache and image_mobject in RESAMPLED_IMAGE_PIXELS:
+            cached_source, cached_key, result = \
+                RESAMPLED_IMAGE_PIXELS[image_mobject]
+            if cached_source is source and cached_key == key:
+                return result
+
+        height, width = source.shape[:2]
+        # Columns are where one step right and down the source go
+        matrix = np.array([
+            (ur_coords - ul_coords) / width,
+            (dl_coords - ul_coords) / height,
+        ]).T
+        if abs(np.linalg.det(matrix)) < 1e-9:
+            return None
+        inverse = np.linalg.inv(matrix)
+        left, top, right, bottom = region
+        offset = np.dot(inverse, np.array([left, top]) - ul_coords)
+        image = Image.fromarray(np.ascontiguousarray(source))
+        size = (right - left, bottom - top)
+        x_scale, y_scale = inverse[0, 0], inverse[1, 1]
+        if inverse[0, 1] == 0 and inverse[1, 0] == 0 and \
+                x_scale > 0 and y_scale > 0:
+            # Neither rotated, sheared nor flipped, so a resize, which
+            # filters one axis at a time and is much faster.  Its box
+            # must lie within the source, so edges may stretch by up to
+            # the part of a pixel the region rounds out by.
+            box = np.clip(
+                [
+                    offset[0], offset[1],
+                    offset[0] + x_scale * size[0],
+                    offset[1] + y_scale * size[1],
+                ],
+                0, [width, height, width, height],
             )
+            result = np.asarray(image.resize(
+                size, resample=Image.BICUBIC, box=tuple(box)
+            ))
+        else:
+            result = np.asarray(image.transform(
+                size,
+                Image.AFFINE,
+                (
+                    inverse[0, 0], inverse[0, 1], offset[0],
+                    inverse[1, 0], inverse[1, 1], offset[1],
+                ),
+                resample=Image.BICUBIC,
+            ))
+        if use_cache:
+            RESAMPLED_IMAGE_PIXELS[image_mobject] = (source, key, result)
+        return result
+
+    def overlay_rgba_array(self, pixel_array, new_array, ul_coords=(0, 0)):
+        """
+        Composites new_array over pixel_array in place, with the upper
+        left pixel of new_array going to ul_coords, given as x, y.
+        Only the pixels under the box around the parts of new_array
+        which aren't fully transparent are touched.
+        """
+        alphas = new_array[:, :, 3]
+        rows = np.flatnonzero(alphas.any(axis=1))
+        if len(rows) == 0:
+            return
+        columns = np.flatnonzero(alphas.any(axis=0))
+        x, y = ul_coords
+        # Clip the box to the pixel array
+        top = max(rows[0], -y)
+        bottom = min(rows[-1] + 1, pixel_array.shape[0] - y)
+        left = max(columns[0], -x)
+        right = min(columns[-1] + 1, pixel_array.shape[1] - x)
+        if top >= bottom or left >= right:
+            return
+        self.alpha_composite_in_place(
+            pixel_array[y + top:y + bottom, x + left:x + right],
+            new_array[top:bottom, left:right],
         )
-        # Paint on top of existing pixel array
-        self.overlay_PIL_image(pixel_array, full_image)
 
-    def overlay_rgba_array(self, pixel_array, new_array):
-        self.overlay_PIL_image(
-            pixel_array,
-            self.get_image(new_array),
-        )
+    def overlay_PIL_image(self, pixel_array, image, ul_coords=(0, 0)):
+        self.overlay_rgba_array(pixel_array, np.asarray(image), ul_coords)
 
-    def overlay_PIL_image(self, pixel_array, image):
-        pixel_array[:, :] = np.array(
-            Image.alpha_composite(
-                self.get_image(pixel_array),
-                image
-            ),
-            dtype='uint8'
+    def alpha_composite_in_place(self, dest, source):
+        # Same as PIL's Image.alpha_composite, writing into dest
+        source_alphas = source[:, :, 3:]
+        if np.all(source_alphas == self.rgb_max_val):
+            dest[:, :] = source
+            return
+        source_alphas = source_alphas / self.rgb_max_val
+        dest_alphas = (1 - source_alphas) * dest[:, :, 3:] / self.rgb_max_val
+        out_alphas = source_alphas + dest_alphas
+        out_rgbs = source[:, :, :3] * source_alphas
+        out_rgbs += dest[:, :, :3] * dest_alphas
+        out_rgbs /= np.maximum(out_alphas, 1e-12)
+        # Like PIL, leave pixels the source doesn't cover as they were,
+        # even fully transparent ones, whose color would otherwise go
+        dest[:, :, :3] = np.where(
+            source[:, :, 3:] == 0, dest[:, :, :3], np.round(out_rgbs)
         )
+        dest[:, :, 3:] = np.round(self.rgb_max_val * out_alphas)
 
     def adjust_out_of_range_points(self, points):
         if not np.any(points > self.max_allowable_norm):
             return points
+        # Not in place, as these may be the points of a mobject
+        points = np.array(points)
         norms = np.apply_along_axis(get_norm, 1, points)
         violator_indices = norms > self.max_allowable_norm
         violators = points[violator_indices, :]
@@ -552,6 +909,10 @@ class Camera(object):
         return points
 
     def points_to_pixel_coords(self, mobject, points):
+        return self.points_to_subpixel_coords(mobject, points).astype('int')
+
+    def points_to_subpixel_coords(self, mobject, points):
+        # Pixel (i, j) covers [i, i + 1) x [j, j + 1) of these
         points = self.transform_points_pre_display(
             mobject, points
         )
@@ -571,7 +932,7 @@ class Camera(object):
 
         result[:, 0] = shifted_points[:, 0] * width_mult + width_add
         result[:, 1] = shifted_points[:, 1] * height_mult + height_add
-        return result.astype('int')
+        return result
 
     def on_screen_pixels(self, pixel_coords):
         return reduce(op.and_, [
@@ -647,43 +1008,21 @@ class Camera(object):
 class BackgroundColoredVMobjectDisplayer(object):
     def __init__(self, camera):
         self.camera = camera
-        self.file_name_to_pixel_array_map = {}
         self.pixel_array = np.array(camera.get_pixel_array())
         self.reset_pixel_array()
 
     def reset_pixel_array(self):
         self.pixel_array[:, :] = 0
 
-    def resize_background_array(
-        self, background_array,
-        new_width, new_height,
-        mode="RGBA"
-    ):
-        image = Image.fromarray(background_array)
-        image = image.convert(mode)
-        resized_image = image.resize((new_width, new_height))
-        return np.array(resized_image)
-
-    def resize_background_array_to_match(self, background_array, pixel_array):
-        height, width = pixel_array.shape[:2]
-        mode = "RGBA" if pixel_array.shape[2] == 4 else "RGB"
-        return self.resize_background_array(background_array, width, height, mode)
-
     def get_background_array(self, file_name):
-        if file_name in self.file_name_to_pixel_array_map:
-            return self.file_name_to_pixel_array_map[file_name]
-        full_path = get_full_raster_image_path(file_name)
-        image = Image.open(full_path)
-        back_array = np.array(image)
-
-        pixel_array = self.pixel_array
-        if not np.all(pixel_array.shape == back_array.shape):
-            back_array = self.resize_background_array_to_match(
-                back_array, pixel_array
-            )
-
-        self.file_name_to_pixel_array_map[file_name] = back_array
-        return back_array
+        # Shared through the process wide cache of decoded images,
+        # so it outlives this displayer and its camera
+        height, width, num_channels = self.pixel_array.shape
+        return get_raster_image_array(
+            file_name,
+            mode="RGBA" if num_channels == 4 else "RGB",
+            size=(width, height),
+        )
 
     def display(self, *cvmobjects):
         batch_image_file_pairs = batch_by_property(
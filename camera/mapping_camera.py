@@ -15,7 +15,9 @@ class MappingCamera(Camera):
     CONFIG = {
         "mapping_func": lambda p: p,
         "min_anchor_points": 50,
-        "allow_object_intrusion": False
+        "allow_object_intrusion": False,
+        # Mobjects are copied and remapped before being drawn
+        "use_static_layer_cache": False,
     }
 
     def points_to_pixel_coords(self, points):
@@ -46,6 +48,10 @@ class MappingCamera(Camera):
 # TODO, the classes below should likely be deleted
 
 class OldMultiCamera(Camera):
+    CONFIG = {
+        "use_static_layer_cache": False,
+    }
+
     def __init__(self, *cameras_with_start_positions, **kwargs):
         self.shifted_cameras = [
             DictAsObject(
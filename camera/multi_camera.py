@@ -7,6 +7,8 @@ from utils.iterables import list_difference_update
 class MultiCamera(MovingCamera):
     CONFIG = {
         "allow_cameras_to_capture_their_own_display": False,
+        # Sub-cameras draw the full list of mobjects themselves
+        "use_static_layer_cache": False,
     }
 
     def __init__(self, *image_mobjects_from_cameras, **kwargs):
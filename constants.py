@@ -3,6 +3,7 @@ import numpy as np
 
 
 env_MEDIA_DIR = None
+saved_MEDIA_DIR = None
 MEDIA_DIR = "#ERROR#"
 
 try:
@@ -13,11 +14,14 @@ except NameError:
     except KeyError:
         pass
 
+if os.path.exists("media_dir.txt"):
+    with open("media_dir.txt", 'r') as media_file:
+        saved_MEDIA_DIR = media_file.readline().strip()
+
 if not (env_MEDIA_DIR is None):
     MEDIA_DIR = env_MEDIA_DIR
-elif os.path.exists("media_dir.txt"):
-    with open("media_dir.txt", 'rU') as media_file:
-        MEDIA_DIR = media_file.readline().strip()
+elif saved_MEDIA_DIR is not None:
+    MEDIA_DIR = saved_MEDIA_DIR
 else:
     MEDIA_DIR = os.path.join(
         os.path.expanduser('~'),
@@ -33,8 +37,10 @@ if not os.path.exists(MEDIA_DIR):
         where movies and images will be written
     """)
 
-with open("media_dir.txt", 'w') as media_file:
-    media_file.write(MEDIA_DIR)
+# Only written when it changes, rather than on every import
+if MEDIA_DIR != saved_MEDIA_DIR:
+    with open("media_dir.txt", 'w') as media_file:
+        media_file.write(MEDIA_DIR)
 #
 
 LOW_QUALITY_FRAME_DURATION = 1. / 15
@@ -129,10 +135,12 @@ TEX_IMAGE_DIR = TEX_DIR  # TODO, What is this doing?
 # These two may be depricated now.
 MOBJECT_DIR = os.path.join(FILE_DIR, "mobjects")
 IMAGE_MOBJECT_DIR = os.path.join(MOBJECT_DIR, "image")
+# Points parsed out of svg files
+SVG_CACHE_DIR = os.path.join(FILE_DIR, "svg_cache")
 
 for folder in [FILE_DIR, RASTER_IMAGE_DIR, SVG_IMAGE_DIR, VIDEO_DIR, TEX_DIR,
                TEX_IMAGE_DIR, MOBJECT_DIR, IMAGE_MOBJECT_DIR,
-               STAGED_SCENES_DIR]:
+               STAGED_SCENES_DIR, SVG_CACHE_DIR]:
     if not os.path.exists(folder):
         os.makedirs(folder)
 
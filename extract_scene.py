@@ -6,10 +6,15 @@ import argparse
 import importlib
 import inspect
 import itertools as it
+import multiprocessing as mp
 import os
 import subprocess as sp
+import tempfile
+import time
 import traceback
 
+from queue import Empty
+
 from constants import *
 
 from scene.scene import Scene
@@ -34,6 +39,15 @@ HELP_MESSAGE = """
    -n specify the number of the animation to start from
    -r specify a resolution
    -c specify a background color
+   --frame_processes <n> render the frames of each animation with n processes
+   --jobs <n> with -a, render n scenes at a time, each in its own process
+   --partial_movie_cache reuse movie files of unchanged play/wait calls from earlier runs
+   --encoder <preset> one of x264, x264_ultrafast, nvenc, ffv1, qtrle, npy, y4m, null
+   --profile time each stage of rendering, and write json, csv and folded reports
+   --null_output render every frame but write nothing, which needs no ffmpeg
+   --checksum with --null_output or --encoder null, print a checksum of all frames
+   --write_frame_manifest write a checksum of every frame next to the movie
+   --check_frame_manifest report the first frame that differs from that manifest
 """
 SCENE_NOT_FOUND_MESSAGE = """
    That scene is not in the script
@@ -76,7 +90,19 @@ def get_configuration():
         parser.add_argument("-n", "--start_at_animation_number")
         parser.add_argument("-r", "--resolution")
         parser.add_argument("-c", "--color")
+        parser.add_argument("--frame_processes")
+        parser.add_argument("--jobs", type=int, default=1)
+        parser.add_argument("--partial_movie_cache", action="store_true")
+        parser.add_argument("--encoder")
+        parser.add_argument("--profile", action="store_true")
+        parser.add_argument("--null_output", action="store_true")
+        parser.add_argument("--checksum", action="store_true")
+        parser.add_argument("--write_frame_manifest", action="store_true")
+        parser.add_argument("--check_frame_manifest", action="store_true")
         args = parser.parse_args()
+        if args.checksum and not (args.null_output or args.encoder == "null"):
+            # Only the null frame sink computes checksums
+            parser.error("--checksum needs --null_output or --encoder null")
         if args.output_name is not None:
             output_name_root, output_name_ext = os.path.splitext(
                 args.output_name)
@@ -111,7 +137,22 @@ def get_configuration():
         "output_name": output_name,
         "start_at_animation_number": args.start_at_animation_number,
         "end_at_animation_number": None,
+        "num_frame_processes": int(args.frame_processes or 1),
+        "num_jobs": max(args.jobs, 1),
+        "use_partial_movie_cache": args.partial_movie_cache,
+        "encoder_preset": args.encoder,
+        "profile_render": args.profile,
+        "frame_sink_config": {},
+        "write_frame_manifest": args.write_frame_manifest,
+        "check_frame_manifest": args.check_frame_manifest,
     }
+    if args.null_output:
+        config["write_to_movie"] = True
+        config["encoder_preset"] = "null"
+        config["open_video_upon_completion"] = False
+        config["show_file_in_finder"] = False
+    if args.checksum:
+        config["frame_sink_config"]["checksum"] = True
 
     # Camera configuration
     config["camera_config"] = {}
@@ -254,6 +295,117 @@ def get_module(file_name):
     return importlib.import_module(module_name)
 
 
+def render_scene_in_subprocess(scene_name, log_file_path, result_queue,
+                               scene_kwargs, config):
+    # Output from all the scenes at once would be unreadable, so
+    # each one, along with ffmpeg and latex, writes to its own log
+    with open(log_file_path, "w") as log_file:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.dup2(log_file.fileno(), 1)
+        os.dup2(log_file.fileno(), 2)
+    sys.stdout = open(1, "w", closefd=False)
+    sys.stderr = open(2, "w", closefd=False)
+    try:
+        SceneClass = getattr(get_module(config["file"]), scene_name)
+        handle_scene(SceneClass(**scene_kwargs), **config)
+        error = None
+    except:
+        traceback.print_exc()
+        error = traceback.format_exc()
+    sys.stdout.flush()
+    sys.stderr.flush()
+    result_queue.put((scene_name, error))
+
+
+def get_log_tail(log_file_path, num_lines=20):
+    if not os.path.exists(log_file_path):
+        return ""
+    with open(log_file_path, errors="replace") as log_file:
+        lines = log_file.read().replace("\r", "\n").splitlines()
+    return "\n".join([line for line in lines if line.strip()][-num_lines:])
+
+
+def render_scenes_in_parallel(scene_classes, scene_kwargs, config):
+    """
+    Renders each scene in a process of its own, num_jobs at a time,
+    printing a line as each one starts and finishes, and a summary
+    of any failures at the end.  Returns the names of the scenes
+    which failed.
+
+    Tex and svg files are cached on disk, where all the processes
+    can pick up what the others have already compiled.
+    """
+    num_jobs = config["num_jobs"]
+    if "fork" in mp.get_all_start_methods():
+        context = mp.get_context("fork")
+    else:
+        context = mp.get_context("spawn")
+    log_dir = tempfile.mkdtemp(prefix="manim_jobs_")
+    result_queue = context.Queue()
+    pending = [SceneClass.__name__ for SceneClass in scene_classes]
+    total = len(pending)
+    running = dict()
+    failures = []
+    num_done = 0
+    start_time = time.time()
+    print("Rendering %d scenes with %d processes, logs in %s" % (
+        total, min(num_jobs, total), log_dir
+    ))
+    while pending or running:
+        while pending and len(running) < num_jobs:
+            scene_name = pending.pop(0)
+            log_file_path = os.path.join(log_dir, scene_name + ".log")
+            process = context.Process(
+                target=render_scene_in_subprocess,
+                args=(scene_name, log_file_path, result_queue,
+                      scene_kwargs, config)
+            )
+            process.start()
+            running[scene_name] = (process, time.time(), log_file_path)
+            print("[%d/%d] Started %s" % (num_done, total, scene_name))
+        finished = []
+        try:
+            finished.append(result_queue.get(timeout=1))
+        except Empty:
+            # Catch processes which died without reporting back,
+            # e.g. when killed for running out of memory
+            for scene_name, (process, _, _) in running.items():
+                if process.exitcode not in [None, 0]:
+                    finished.append((
+                        scene_name,
+                        "Process exited with code %d" % process.exitcode
+                    ))
+        for scene_name, error in finished:
+            if scene_name not in running:
+                continue
+            process, scene_start_time, log_file_path = running.pop(scene_name)
+            process.join()
+            num_done += 1
+            if error is None:
+                os.remove(log_file_path)
+                status = "Finished"
+            else:
+                failures.append((scene_name, error, log_file_path))
+                status = "FAILED"
+            print("[%d/%d] %s %s in %.1fs (%d running, %d waiting)" % (
+                num_done, total, status, scene_name,
+                time.time() - scene_start_time,
+                len(running), len(pending),
+            ))
+    print("\nRendered %d of %d scenes in %.1fs" % (
+        total - len(failures), total, time.time() - start_time
+    ))
+    if failures:
+        print("\n%d scenes failed:" % len(failures))
+        for scene_name, error, log_file_path in failures:
+            print("\n%s (full log in %s)" % (scene_name, log_file_path))
+            print(get_log_tail(log_file_path) or error)
+    else:
+        os.rmdir(log_dir)
+    return [scene_name for scene_name, error, log_file_path in failures]
+
+
 def main():
     config = get_configuration()
     module = get_module(config["file"])
@@ -275,6 +427,13 @@ def main():
             "movie_file_extension",
             "start_at_animation_number",
             "end_at_animation_number",
+            "num_frame_processes",
+            "use_partial_movie_cache",
+            "encoder_preset",
+            "profile_render",
+            "frame_sink_config",
+            "write_frame_manifest",
+            "check_frame_manifest",
         ]
     ])
 
@@ -284,7 +443,18 @@ def main():
         scene_kwargs["save_pngs"] = True
         scene_kwargs["pngs_mode"] = config["saved_image_mode"]
 
-    for SceneClass in get_scene_classes(scene_names_to_classes, config):
+    scene_classes = get_scene_classes(scene_names_to_classes, config)
+    if config["num_jobs"] > 1 and len(scene_classes) > 1:
+        failures = render_scenes_in_parallel(
+            scene_classes, scene_kwargs, config
+        )
+        if failures:
+            play_error_sound()
+        else:
+            play_finish_sound()
+        return
+
+    for SceneClass in scene_classes:
         try:
             handle_scene(SceneClass(**scene_kwargs), **config)
             play_finish_sound()
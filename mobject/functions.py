@@ -19,10 +19,11 @@ class ParametricFunction(VMobject):
 
     def generate_points(self):
         n_points = 3 * self.num_anchor_points - 2
-        self.points = np.zeros((n_points, self.dim))
-        self.points[:, 0] = np.linspace(
+        points = np.zeros((n_points, self.dim))
+        points[:, 0] = np.linspace(
             self.t_min, self.t_max, n_points
         )
+        self.points = points
         # VMobject.apply_function takes care of preserving
         # desirable tangent line properties at anchor points
         self.apply_function(lambda p: self.function(p[0]))
@@ -5,6 +5,7 @@ import numpy as np
 import operator as op
 import os
 import random
+import weakref
 
 from colour import Color
 
@@ -25,6 +26,11 @@ from utils.space_ops import get_norm
 from functools import reduce
 
 
+# Min and max corners of each mobject's own points, cleared whenever
+# its points are set.  This lives outside of the mobjects themselves
+# so that copying or hashing a mobject never sees it.
+POINTS_BOUNDING_BOXES = weakref.WeakKeyDictionary()
+
 # TODO: Explain array_attrs
 
 class Mobject(Container):
@@ -82,6 +88,26 @@ class Mobject(Container):
                 self.submobjects.remove(mobject)
         return self
 
+    @property
+    def points(self):
+        return self._points
+
+    @points.setter
+    def points(self, points):
+        # Points are read-only, so that changing them in place, which
+        # would leave the cached bounding box stale, fails loudly.
+        # Assign a new array instead, e.g. mob.points = mob.points + v
+        if isinstance(points, np.ndarray):
+            points.flags.writeable = False
+        self._points = points
+        POINTS_BOUNDING_BOXES.pop(self, None)
+
+    def __setstate__(self, state):
+        # Copies made by deepcopy and unpickling have writeable arrays
+        self.__dict__.update(state)
+        if "_points" in state:
+            self.points = self._points
+
     def get_array_attrs(self):
         return ["points"]
 
@@ -130,7 +156,9 @@ class Mobject(Container):
         for attr, value in list(self.__dict__.items()):
             if isinstance(value, Mobject) and value in family and value is not self:
                 setattr(copy_mobject, attr, value.copy())
-            if isinstance(value, np.ndarray):
+            # Read-only arrays can be shared, as they're never
+            # changed in place
+            if isinstance(value, np.ndarray) and value.flags.writeable:
                 setattr(copy_mobject, attr, np.array(value))
         return copy_mobject
 
@@ -197,8 +225,7 @@ class Mobject(Container):
     def shift(self, *vectors):
         total_vector = reduce(op.add, vectors)
         for mob in self.family_members_with_points():
-            mob.points = mob.points.astype('float')
-            mob.points += total_vector
+            mob.points = mob.points.astype('float') + total_vector
         return self
 
     def scale(self, scale_factor, **kwargs):
@@ -281,7 +308,7 @@ class Mobject(Container):
             alphas -= min(alphas)
             alphas /= max(alphas)
             alphas = alphas**wag_factor
-            mob.points += np.dot(
+            mob.points = mob.points + np.dot(
                 alphas.reshape((len(alphas), 1)),
                 np.array(direction).reshape((1, mob.dim))
             )
@@ -316,9 +343,8 @@ class Mobject(Container):
             assert(about_edge is not None)
             about_point = self.get_critical_point(about_edge)
         for mob in self.family_members_with_points():
-            mob.points -= about_point
-            mob.points = func(mob.points)
-            mob.points += about_point
+            # Not in place, since other mobjects may share these points
+            mob.points = func(mob.points - about_point) + about_point
         return self
 
     def rotate_in_place(self, angle, axis=OUT):
@@ -689,14 +715,13 @@ class Mobject(Container):
         ]
 
     def get_merged_array(self, array_attr):
-        result = getattr(self, array_attr)
-        for submob in self.submobjects:
-            result = np.append(
-                result, submob.get_merged_array(array_attr),
-                axis=0
-            )
-            submob.get_merged_array(array_attr)
-        return result
+        arrays = [
+            getattr(mob, array_attr)
+            for mob in self.get_family_with_repeats()
+        ]
+        if len(arrays) == 1:
+            return arrays[0]
+        return np.concatenate(arrays, axis=0)
 
     def get_all_points(self):
         return self.get_merged_array("points")
@@ -709,24 +734,45 @@ class Mobject(Container):
     def get_num_points(self):
         return len(self.points)
 
-    def get_critical_point(self, direction):
-        result = np.zeros(self.dim)
-        all_points = self.get_all_points()
-        if len(all_points) == 0:
-            return result
-        for dim in range(self.dim):
-            if direction[dim] <= 0:
-                min_val = min(all_points[:, dim])
-            if direction[dim] >= 0:
-                max_val = max(all_points[:, dim])
-
-            if direction[dim] == 0:
-                result[dim] = (max_val + min_val) / 2
-            elif direction[dim] < 0:
-                result[dim] = min_val
+    def get_points_bounding_box(self):
+        """
+        Array of the min and max corners of this mobject's own points,
+        ignoring submobjects, or an empty array if it has none
+        """
+        box = POINTS_BOUNDING_BOXES.get(self)
+        if box is None:
+            points = self.points
+            if len(points) == 0:
+                box = np.zeros((0, self.dim))
             else:
-                result[dim] = max_val
-        return result
+                box = np.array([points.min(0), points.max(0)])
+            POINTS_BOUNDING_BOXES[self] = box
+        return box
+
+    def get_bounding_box(self):
+        """
+        Min and max corners of all points in the family, put together
+        from each member's cached box.  None if there are no points.
+        """
+        boxes = [
+            mob.get_points_bounding_box()
+            for mob in self.get_family_with_repeats()
+        ]
+        corners = boxes[0] if len(boxes) == 1 else np.concatenate(boxes)
+        if len(corners) == 0:
+            return None
+        return np.array([corners.min(0), corners.max(0)])
+
+    def get_critical_point(self, direction):
+        bounding_box = self.get_bounding_box()
+        if bounding_box is None:
+            return np.zeros(self.dim)
+        min_vals, max_vals = bounding_box
+        direction = np.sign(direction[:self.dim])
+        return np.where(
+            direction < 0, min_vals,
+            np.where(direction > 0, max_vals, (min_vals + max_vals) / 2)
+        )
 
     # Pseudonyms for more general get_critical_point method
 
@@ -771,10 +817,10 @@ class Mobject(Container):
         return self.get_edge_center(IN)
 
     def length_over_dim(self, dim):
-        return (
-            self.reduce_across_dimension(np.max, np.max, dim) -
-            self.reduce_across_dimension(np.min, np.min, dim)
-        )
+        bounding_box = self.get_bounding_box()
+        if bounding_box is None:
+            return 0
+        return bounding_box[1, dim] - bounding_box[0, dim]
 
     def get_width(self):
         return self.length_over_dim(0)
@@ -821,10 +867,22 @@ class Mobject(Container):
         result = [self] if len(self.points) > 0 else []
         return result + self.submobjects
 
+    def get_family_with_repeats(self):
+        # Depth first, parents before children, so that a mobject
+        # appearing in more than one place shows up more than once
+        result = []
+        stack = [self]
+        while stack:
+            mob = stack.pop()
+            result.append(mob)
+            stack.extend(reversed(mob.submobjects))
+        return result
+
     def get_family(self):
-        sub_families = list(map(Mobject.get_family, self.submobjects))
-        all_mobjects = [self] + list(it.chain(*sub_families))
-        return remove_list_redundancies(all_mobjects)
+        result = self.get_family_with_repeats()
+        if len(set(map(id, result))) < len(result):
+            return remove_list_redundancies(result)
+        return result
 
     def family_members_with_points(self):
         return [m for m in self.get_family() if m.get_num_points() > 0]
@@ -1,8 +1,14 @@
 from constants import *
 
 from mobject.svg.tex_mobject import SingleStringTexMobject
+from mobject.svg.tex_mobject import get_single_string_tex_file_args
+from utils.tex_file_writing import tex_to_svg_files
 from mobject.types.vectorized_mobject import VMobject
 
+# SingleStringTexMobjects for each character and config seen so
+# far, which DecimalNumbers copy rather than building their own
+GLYPH_CACHE = {}
+
 
 class DecimalNumber(VMobject):
     CONFIG = {
@@ -34,14 +40,23 @@ class DecimalNumber(VMobject):
             else:
                 num_string = num_string[1:]
 
+        # Compile any characters not seen before all at once
+        new_chars = [
+            char for char in num_string
+            if self.get_glyph_key(char, kwargs) not in GLYPH_CACHE
+        ]
+        if new_chars:
+            tex_to_svg_files(
+                get_single_string_tex_file_args(new_chars, **kwargs)
+            )
         self.add(*[
-            SingleStringTexMobject(char, **kwargs)
+            self.get_glyph(char, **kwargs)
             for char in num_string
         ])
 
         # Add non-numerical bits
         if self.show_ellipsis:
-            self.add(SingleStringTexMobject("\\dots"))
+            self.add(self.get_glyph("\\dots"))
 
         if num_string.startswith("-"):
             minus = self.submobjects[0]
@@ -51,7 +66,7 @@ class DecimalNumber(VMobject):
             )
 
         if self.unit is not None:
-            self.unit_sign = SingleStringTexMobject(self.unit, color=self.color)
+            self.unit_sign = self.get_glyph(self.unit, color=self.color)
             self.add(self.unit_sign)
 
         self.arrange_submobjects(
@@ -72,6 +87,19 @@ class DecimalNumber(VMobject):
         if self.include_background_rectangle:
             self.add_background_rectangle()
 
+    def get_glyph_key(self, tex_string, config):
+        return (tex_string, repr(sorted(config.items())))
+
+    def get_glyph(self, tex_string, **config):
+        key = self.get_glyph_key(tex_string, config)
+        if key not in GLYPH_CACHE:
+            GLYPH_CACHE[key] = SingleStringTexMobject(tex_string, **config)
+        glyph = GLYPH_CACHE[key].copy()
+        # Copies share lists like updaters with the cached glyph
+        for mob in glyph.get_family():
+            mob.updaters = []
+        return glyph
+
     def get_formatter(self, **kwargs):
         """
         Configuration is based first off instance attributes,
@@ -115,7 +143,7 @@ class DecimalNumber(VMobject):
         for mob in old_family:
             # Dumb hack...due to how scene handles families
             # of animated mobjects
-            mob.points[:] = 0
+            mob.points = np.zeros(mob.points.shape)
         self.number = number
         return self
 
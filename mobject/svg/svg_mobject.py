@@ -1,3 +1,4 @@
+import hashlib
 import itertools as it
 import re
 import string
@@ -27,6 +28,11 @@ def string_to_numbers(num_string):
     ]
 
 
+# Points and structure of parsed svg files, keyed by
+# SVGMobject.get_svg_cache_key
+SVG_CACHE = {}
+
+
 class SVGMobject(VMobject):
     CONFIG = {
         "should_center": True,
@@ -39,6 +45,9 @@ class SVGMobject(VMobject):
         "fill_opacity": 1.0,
         # "fill_color" : LIGHT_GREY,
         "propagate_style_to_family": True,
+        # Reuse the points from earlier parses of the same file, kept
+        # in memory and in SVG_CACHE_DIR
+        "use_svg_cache": True,
     }
 
     def __init__(self, file_name=None, **kwargs):
@@ -66,6 +75,10 @@ class SVGMobject(VMobject):
                       self.file_name)
 
     def generate_points(self):
+        svg_data = self.get_cached_svg_data()
+        if svg_data is not None:
+            self.add(*self.svg_data_to_mobjects(svg_data))
+            return
         doc = minidom.parse(self.file_path)
         self.ref_to_element = {}
         for svg in doc.getElementsByTagName("svg"):
@@ -75,6 +88,131 @@ class SVGMobject(VMobject):
             else:
                 self.add(*mobjects[0].submobjects)
         doc.unlink()
+        self.cache_svg_data()
+
+    # Caching parsed svgs
+
+    def get_svg_cache_key(self):
+        stat = os.stat(self.file_path)
+        id_str = str([
+            os.path.abspath(self.file_path),
+            stat.st_mtime,
+            stat.st_size,
+            self.unpack_groups,
+            # Subclasses may make different mobjects from paths
+            self.path_string_to_mobject.__func__.__qualname__,
+        ])
+        return hashlib.sha256(id_str.encode()).hexdigest()[:32]
+
+    def get_svg_cache_file_path(self, key):
+        return os.path.join(SVG_CACHE_DIR, key + ".npz")
+
+    def get_cached_svg_data(self):
+        if not self.use_svg_cache:
+            return None
+        key = self.get_svg_cache_key()
+        if key in SVG_CACHE:
+            return SVG_CACHE[key]
+        file_path = self.get_svg_cache_file_path(key)
+        if not os.path.exists(file_path):
+            return None
+        try:
+            with np.load(file_path) as npz_file:
+                svg_data = dict(npz_file.items())
+        except Exception:
+            # Half written or otherwise bad file, so parse again
+            return None
+        SVG_CACHE[key] = svg_data
+        return svg_data
+
+    def cache_svg_data(self):
+        if not self.use_svg_cache:
+            return
+        svg_data = self.mobjects_to_svg_data(self.submobjects)
+        if svg_data is None:
+            return
+        key = self.get_svg_cache_key()
+        SVG_CACHE[key] = svg_data
+        file_path = self.get_svg_cache_file_path(key)
+        temp_file_path = file_path + ".%d.tmp" % os.getpid()
+        with open(temp_file_path, "wb") as fp:
+            np.savez(fp, **svg_data)
+        os.rename(temp_file_path, file_path)
+
+    def mobjects_to_svg_data(self, mobjects):
+        """
+        Flattens the mobjects made from a parse into arrays.  Each
+        mobject gets a row of (kind, number of points, number of
+        submobjects, length of path string), in depth first order,
+        where kind is 0 for a VGroup, 1 for a path and 2 for one of
+        its subpaths.  Returns None if there's anything else, like
+        Circles from circle elements, which are left uncached.
+        """
+        rows = []
+        point_arrays = []
+        path_strings = []
+
+        def add_mobject(mob):
+            if type(mob) is VGroup:
+                rows.append((0, 0, len(mob.submobjects), 0))
+                return all(map(add_mobject, mob.submobjects))
+            if not isinstance(mob, VMobjectFromSVGPathstring):
+                return False
+            subpaths = mob.submobjects
+            if not all([sp.is_subpath and not sp.submobjects for sp in subpaths]):
+                return False
+            path_string = mob.path_string.encode()
+            rows.append((1, len(mob.points), len(subpaths), len(path_string)))
+            point_arrays.append(mob.points)
+            path_strings.append(path_string)
+            for subpath in subpaths:
+                rows.append((2, len(subpath.points), 0, 0))
+                point_arrays.append(subpath.points)
+            return True
+
+        if not all(map(add_mobject, mobjects)):
+            return None
+        point_arrays = [pa.reshape((-1, self.dim)) for pa in point_arrays]
+        return {
+            "rows": np.array(rows, dtype='int64').reshape((-1, 4)),
+            "points": np.vstack([np.zeros((0, self.dim))] + point_arrays),
+            "path_strings": np.frombuffer(b"".join(path_strings), dtype='uint8'),
+        }
+
+    def svg_data_to_mobjects(self, svg_data):
+        rows = svg_data["rows"]
+        points = svg_data["points"]
+        path_strings = svg_data["path_strings"].tobytes()
+        # Positions in rows, points and path_strings
+        indices = [0, 0, 0]
+
+        def next_row():
+            kind, num_points, num_submobjects, string_length = rows[indices[0]]
+            mob_points = points[indices[1]:indices[1] + num_points]
+            path_string = path_strings[indices[2]:indices[2] + string_length]
+            indices[0] += 1
+            indices[1] += num_points
+            indices[2] += string_length
+            return kind, mob_points, num_submobjects, path_string.decode()
+
+        def get_mobject():
+            kind, mob_points, num_submobjects, path_string = next_row()
+            if kind == 0:
+                return VGroup(*[
+                    get_mobject() for x in range(num_submobjects)
+                ])
+            # Empty path string, so nothing gets parsed
+            mob = self.path_string_to_mobject("")
+            mob.path_string = path_string
+            mob.set_points(mob_points)
+            for x in range(num_submobjects):
+                mob.add_subpath(next_row()[1])
+            return mob
+
+        result = []
+        while indices[0] < len(rows):
+            result.append(get_mobject())
+        return result
 
     def get_mobjects_from(self, element):
         result = []
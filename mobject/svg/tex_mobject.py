@@ -6,6 +6,7 @@ from .svg_mobject import VMobjectFromSVGPathstring
 from utils.config_ops import digest_config
 from utils.strings import split_string_list_to_isolate_substrings
 from utils.tex_file_writing import tex_to_svg_file
+from utils.tex_file_writing import tex_to_svg_files
 from mobject.geometry import Line
 from mobject.types.vectorized_mobject import VGroup
 from mobject.types.vectorized_mobject import VectorizedPoint
@@ -41,16 +42,19 @@ class SingleStringTexMobject(SVGMobject):
         digest_config(self, kwargs)
         assert(isinstance(tex_string, str))
         self.tex_string = tex_string
-        file_name = tex_to_svg_file(
-            self.get_modified_expression(tex_string),
-            self.template_tex_file_body
-        )
+        file_name = tex_to_svg_file(*self.get_tex_file_args(tex_string))
         SVGMobject.__init__(self, file_name=file_name, **kwargs)
         if self.height is None:
             self.scale(TEX_MOB_SCALE_FACTOR)
         if self.organize_left_to_right:
             self.organize_submobjects_left_to_right()
 
+    def get_tex_file_args(self, tex_string):
+        return (
+            self.get_modified_expression(tex_string),
+            self.template_tex_file_body,
+        )
+
     def get_modified_expression(self, tex_string):
         result = self.alignment + " " + tex_string
         result = result.strip()
@@ -141,6 +145,12 @@ class TexMobject(SingleStringTexMobject):
         digest_config(self, kwargs)
         tex_strings = self.break_up_tex_strings(tex_strings)
         self.tex_strings = tex_strings
+        # Compile the full string along with the substrings which
+        # break_up_by_substrings will need, all at once
+        tex_to_svg_files(
+            [self.get_tex_file_args(self.arg_separator.join(tex_strings))] +
+            get_single_string_tex_file_args(tex_strings, **self.CONFIG)
+        )
         SingleStringTexMobject.__init__(
             self, self.arg_separator.join(tex_strings), **kwargs
         )
@@ -246,6 +256,18 @@ class TexMobject(SingleStringTexMobject):
             return super(TexMobject, self).split()
 
 
+def get_single_string_tex_file_args(tex_strings, **kwargs):
+    """
+    Arguments to tex_to_svg_file for SingleStringTexMobjects
+    made from each of tex_strings with config kwargs, so that
+    they can be compiled ahead of time with tex_to_svg_files
+    """
+    # Only the config matters here, so skip __init__
+    mob = SingleStringTexMobject.__new__(SingleStringTexMobject)
+    digest_config(mob, kwargs)
+    return [mob.get_tex_file_args(tex_string) for tex_string in tex_strings]
+
+
 class TextMobject(TexMobject):
     CONFIG = {
         "template_tex_file_body": TEMPLATE_TEXT_FILE_BODY,
@@ -1,8 +1,7 @@
 
 
 import numpy as np
-
-from PIL import Image
+import weakref
 
 from constants import *
 
@@ -11,7 +10,14 @@ from mobject.shape_matchers import SurroundingRectangle
 from utils.bezier import interpolate
 from utils.color import color_to_int_rgb
 from utils.config_ops import digest_config
-from utils.images import get_full_raster_image_path
+from utils.images import get_raster_image_array
+from utils.images import halve_rgba_array
+
+# For each image mobject, the pixel array version its mipmap was
+# built from and the levels built so far, the first being the pixel
+# array itself.  Like bounding boxes, these live outside of the
+# mobjects so that copying or hashing one never sees them.
+IMAGE_MIPMAPS = weakref.WeakKeyDictionary()
 
 
 class AbstractImageMobject(Mobject):
@@ -21,11 +27,51 @@ class AbstractImageMobject(Mobject):
     CONFIG = {
         "height": 2.0,
         "pixel_array_dtype": "uint8",
+        # Whether cameras may keep the pixels they resample from
+        # get_pixel_array, reusing them while the image doesn't move.
+        # Subclasses whose pixel array changes in place must call
+        # pixel_array_changed after each change.
+        "cache_resampled_pixels": True,
+        # Whether cameras showing the image at a fraction of its size
+        # sample from a copy scaled down by a power of two, built when
+        # first needed, rather than the full pixel array
+        "use_mipmaps": True,
     }
 
     def get_pixel_array(self):
         raise Exception("Not implemented")
 
+    def get_pixel_array_version(self):
+        return getattr(self, "pixel_array_version", 0)
+
+    def pixel_array_changed(self):
+        self.pixel_array_version = self.get_pixel_array_version() + 1
+        return self
+
+    def get_pixel_array_for_scale(self, scale):
+        """
+        scale is the number of pixels of the image per pixel on
+        screen.  Returns the smallest level of the image's mipmap
+        still at least as large as it's shown, so resampling it
+        costs about as much as the pixels on screen.
+        """
+        pixel_array = self.get_pixel_array()
+        if not self.use_mipmaps or scale < 2:
+            return pixel_array
+        version = self.get_pixel_array_version()
+        mipmap_version, mipmaps = IMAGE_MIPMAPS.get(self, (None, None))
+        if mipmaps is None or mipmaps[0] is not pixel_array or \
+                mipmap_version != version:
+            mipmaps = [pixel_array]
+            IMAGE_MIPMAPS[self] = (version, mipmaps)
+        level = int(np.log2(scale))
+        while len(mipmaps) <= level:
+            last = mipmaps[-1]
+            if min(last.shape[:2]) < 2:
+                break
+            mipmaps.append(halve_rgba_array(last))
+        return mipmaps[min(level, len(mipmaps) - 1)]
+
     def set_color(self):
         # Likely to be implemented in subclasses, but no obgligation
         pass
@@ -47,6 +93,14 @@ class AbstractImageMobject(Mobject):
 
 
 class ImageMobject(AbstractImageMobject):
+    """
+    The pixel_array is read-only, since cameras keep mipmaps and
+    resampled pixels made from it, which changing it in place would
+    leave stale.  To change the image, assign a new array, e.g.
+        pixel_array = np.array(image_mobject.pixel_array)
+        pixel_array[:, :, 3] = alphas
+        image_mobject.pixel_array = pixel_array
+    """
     CONFIG = {
         "invert": False,
         "image_mode": "RGBA",
@@ -55,16 +109,35 @@ class ImageMobject(AbstractImageMobject):
     def __init__(self, filename_or_array, **kwargs):
         digest_config(self, kwargs)
         if isinstance(filename_or_array, str):
-            path = get_full_raster_image_path(filename_or_array)
-            image = Image.open(path).convert(self.image_mode)
-            self.pixel_array = np.array(image)
+            # Copied, as the cached array is shared
+            self.pixel_array = np.array(get_raster_image_array(
+                filename_or_array, self.image_mode
+            ))
         else:
             self.pixel_array = np.array(filename_or_array)
         self.change_to_rgba_array()
         if self.invert:
-            self.pixel_array[:, :, :3] = 255 - self.pixel_array[:, :, :3]
+            pixel_array = np.array(self.pixel_array)
+            pixel_array[:, :, :3] = 255 - pixel_array[:, :, :3]
+            self.pixel_array = pixel_array
         AbstractImageMobject.__init__(self, **kwargs)
 
+    @property
+    def pixel_array(self):
+        return self._pixel_array
+
+    @pixel_array.setter
+    def pixel_array(self, pixel_array):
+        if isinstance(pixel_array, np.ndarray):
+            pixel_array.flags.writeable = False
+        self._pixel_array = pixel_array
+        self.pixel_array_changed()
+
+    def __setstate__(self, state):
+        AbstractImageMobject.__setstate__(self, state)
+        if "_pixel_array" in state:
+            self.pixel_array = self._pixel_array
+
     def change_to_rgba_array(self):
         pa = self.pixel_array
         if len(pa.shape) == 2:
@@ -84,16 +157,20 @@ class ImageMobject(AbstractImageMobject):
 
     def set_color(self, color, alpha=None, family=True):
         rgb = color_to_int_rgb(color)
-        self.pixel_array[:, :, :3] = rgb
+        pixel_array = np.array(self.pixel_array)
+        pixel_array[:, :, :3] = rgb
         if alpha is not None:
-            self.pixel_array[:, :, 3] = int(255 * alpha)
+            pixel_array[:, :, 3] = int(255 * alpha)
+        self.pixel_array = pixel_array
         for submob in self.submobjects:
             submob.set_color(color, alpha, family)
         self.color = color
         return self
 
     def set_opacity(self, alpha):
-        self.pixel_array[:, :, 3] = int(255 * alpha)
+        pixel_array = np.array(self.pixel_array)
+        pixel_array[:, :, 3] = int(255 * alpha)
+        self.pixel_array = pixel_array
         return self
 
     def fade_no_recurse(self, darkness=0.5):
@@ -113,6 +190,9 @@ class ImageMobject(AbstractImageMobject):
 
 class ImageMobjectFromCamera(AbstractImageMobject):
     CONFIG = {
+        # The camera's pixels change from frame to frame in place
+        "cache_resampled_pixels": False,
+        "use_mipmaps": False,
         "default_display_frame_config": {
             "stroke_width": 3,
             "stroke_color": WHITE,
@@ -17,6 +17,23 @@ class PMobject(Mobject):
         "stroke_width": DEFAULT_STROKE_WIDTH,
     }
 
+    @property
+    def rgbas(self):
+        return self._rgbas
+
+    @rgbas.setter
+    def rgbas(self, rgbas):
+        # Read-only like points, so that cameras can tell whether
+        # they've changed by identity alone
+        if isinstance(rgbas, np.ndarray):
+            rgbas.flags.writeable = False
+        self._rgbas = rgbas
+
+    def __setstate__(self, state):
+        Mobject.__setstate__(self, state)
+        if "_rgbas" in state:
+            self.rgbas = self._rgbas
+
     def reset_points(self):
         self.rgbas = np.zeros((0, 4))
         self.points = np.zeros((0, 3))
@@ -49,7 +66,7 @@ class PMobject(Mobject):
         rgba = color_to_rgba(color)
         mobs = self.family_members_with_points() if family else [self]
         for mob in mobs:
-            mob.rgbas[:, :] = rgba
+            mob.rgbas = np.repeat([rgba], len(mob.rgbas), axis=0)
         self.color = color
         return self
 
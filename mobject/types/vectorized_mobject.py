@@ -1,15 +1,18 @@
 
 import itertools as it
+from functools import lru_cache
 from colour import Color
 
 from mobject.mobject import Mobject
 from mobject.three_d_utils import get_3d_vmob_gradient_start_and_end_points
 from constants import *
 from utils.bezier import bezier
+from utils.bezier import get_partial_bezier_matrices
 from utils.bezier import get_smooth_handle_points
 from utils.bezier import interpolate
 from utils.bezier import is_closed
 from utils.bezier import partial_bezier_points
+from utils.bezier import partial_bezier_points_of_curves
 from utils.color import color_to_rgba
 from utils.iterables import make_even
 from utils.iterables import tuplify
@@ -17,6 +20,41 @@ from utils.iterables import stretch_array_to_length
 from utils.simple_functions import clip_in_place
 
 
+@lru_cache(maxsize=256)
+def get_anchor_insertion_plan(num_curves, n):
+    """
+    How to turn num_curves cubics into num_curves + n of them,
+    as the index of the cubic each new one is cut from, and the
+    matrix taking that cubic's points to the new one's.
+
+    Transforms between the same shapes keep asking for the same
+    plans, so they are only worked out once.
+    """
+    # Curves in self are buckets, and we need to know
+    # how many new anchor points to put into each one.
+    # Each element of index_allocation is like a bucket,
+    # and its value tells you the appropriate index of
+    # the smaller curve.
+    index_allocation = (np.arange(num_curves + n) *
+                        num_curves) // (num_curves + n)
+    # Each bucket becomes the portion of its curve from
+    # piece / num_pieces to (piece + 1) / num_pieces
+    num_pieces = np.bincount(index_allocation, minlength=num_curves)
+    first_pieces = np.cumsum(num_pieces) - num_pieces
+    pieces = np.arange(len(index_allocation)) - \
+        first_pieces[index_allocation]
+    counts = num_pieces[index_allocation]
+    a_values = pieces * (1. / counts)
+    b_values = np.where(
+        pieces + 1 == counts, 1., (pieces + 1) * (1. / counts)
+    )
+    matrices = get_partial_bezier_matrices(3, a_values, b_values)
+    # Shared between every caller
+    index_allocation.flags.writeable = False
+    matrices.flags.writeable = False
+    return index_allocation, matrices
+
+
 class VMobject(Mobject):
     CONFIG = {
         "fill_color": None,
@@ -318,8 +356,11 @@ class VMobject(Mobject):
     # Drawing
     def start_at(self, point):
         if len(self.points) == 0:
-            self.points = np.zeros((1, 3))
-        self.points[0] = point
+            points = np.zeros((1, 3))
+        else:
+            points = np.array(self.points)
+        points[0] = point
+        self.points = points
         return self
 
     def add_control_points(self, control_points):
@@ -338,11 +379,12 @@ class VMobject(Mobject):
         assert(len(anchors) == len(handles1) + 1)
         assert(len(anchors) == len(handles2) + 1)
         total_len = 3 * (len(anchors) - 1) + 1
-        self.points = np.zeros((total_len, self.dim))
-        self.points[0] = anchors[0]
+        points = np.zeros((total_len, self.dim))
+        points[0] = anchors[0]
         arrays = [handles1, handles2, anchors[1:]]
         for index, array in enumerate(arrays):
-            self.points[index + 1::3] = array
+            points[index + 1::3] = array
+        self.points = points
         return self.points
 
     def set_points_as_corners(self, points):
@@ -510,30 +552,18 @@ class VMobject(Mobject):
         if curr == 0:
             self.points = np.zeros((1, 3))
             n = n - 1
+            curr = 1
         if curr == 1:
             self.points = np.repeat(self.points, 3 * n + 1, axis=0)
             return self
-        points = np.array([self.points[0]])
-        num_curves = curr - 1
-        # Curves in self are buckets, and we need to know
-        # how many new anchor points to put into each one.
-        # Each element of index_allocation is like a bucket,
-        # and its value tells you the appropriate index of
-        # the smaller curve.
-        index_allocation = (np.arange(curr + n - 1) *
-                            num_curves) // (curr + n - 1)
-        for index in range(num_curves):
-            curr_bezier_points = self.points[3 * index:3 * index + 4]
-            num_inter_curves = sum(index_allocation == index)
-            alphas = np.linspace(0, 1, num_inter_curves + 1)
-            # alphas = np.arange(0, num_inter_curves+1)/float(num_inter_curves)
-            for a, b in zip(alphas, alphas[1:]):
-                new_points = partial_bezier_points(
-                    curr_bezier_points, a, b
-                )
-                points = np.append(
-                    points, new_points[1:], axis=0
-                )
+        index_allocation, matrices = get_anchor_insertion_plan(curr - 1, n)
+        curves = self.points[3 * index_allocation[:, np.newaxis] + np.arange(4)]
+        new_curves = np.matmul(matrices, curves)
+        points = np.append(
+            self.points[:1],
+            new_curves[:, 1:].reshape((-1, self.dim)),
+            axis=0
+        )
         self.set_points(points)
         return self
 
@@ -601,15 +631,14 @@ class VMobject(Mobject):
             b_residue = (num_cubics * b) % 1
             if b == 1:
                 b_residue = 1
-            elif lower_index == upper_index:
-                b_residue = (b_residue - a_residue) / (1 - a_residue)
-
-            points[:4] = partial_bezier_points(
-                points[:4], a_residue, 1
-            )
-            points[-4:] = partial_bezier_points(
-                points[-4:], 0, b_residue
-            )
+            if len(points) == 4:
+                # Start and end lie on the same cubic
+                points = partial_bezier_points(points, a_residue, b_residue)
+            else:
+                points[:4], points[-4:] = partial_bezier_points_of_curves(
+                    [points[:4], points[-4:]],
+                    [a_residue, 0], [1, b_residue]
+                )
         self.set_points(points)
         return self
 
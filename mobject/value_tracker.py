@@ -22,7 +22,9 @@ class ValueTracker(Mobject):
         return self.points[0, 0]
 
     def set_value(self, value):
-        self.points[0, 0] = value
+        points = np.array(self.points)
+        points[0, 0] = value
+        self.points = points
         return self
 
     def increment_value(self, d_value):
@@ -316,7 +316,9 @@ class ShowLightAndSlidingObject(MultilayeredScene, TryManyPaths, PhotonScene):
             if path.get_height() > self.total_glass_height:
                 path.stretch(0.7, 1)
                 path.shift(self.top - path.get_top())
-            path.rgbas[:,2] = 0
+            rgbas = np.array(path.rgbas)
+            rgbas[:,2] = 0
+            path.rgbas = rgbas
         loop = paths.pop(1) ##Bad!
         randy = Randolph()
         randy.scale(RANDY_SCALE_FACTOR)
@@ -1684,9 +1684,11 @@ class FluidFlowAsHillGradient(CylinderModel, ThreeDScene):
             }
         )
         for line in stream_lines:
-            line.points[:, 2] = np.apply_along_axis(
-                potential, 1, line.points
+            points = np.array(line.points)
+            points[:, 2] = np.apply_along_axis(
+                potential, 1, points
             )
+            line.points = points
         stream_lines_animation = self.get_stream_lines_animation(
             stream_lines
         )
@@ -319,7 +319,9 @@ def make_transparent(image_mob):
         dtype = 'uint8'
     )
     image_mob.set_color(WHITE)
-    image_mob.pixel_array[:,:,3] = alpha_vect
+    pixel_array = np.array(image_mob.pixel_array)
+    pixel_array[:,:,3] = alpha_vect
+    image_mob.pixel_array = pixel_array
     return image_mob
 
 ###############################
@@ -1523,10 +1525,11 @@ class BreakUpMacroPatterns(IntroduceEachLayer):
         for mob in mobs:
             for i, j in it.product([0, 14], [0, 14]):
                 pattern = mob.deepcopy()
-                pa = pattern[1].pixel_array
+                pa = np.array(pattern[1].pixel_array)
                 temp = np.array(pa[i:i+14,j:j+14,:], dtype = 'uint8')
                 pa[:,:] = 0
                 pa[i:i+14,j:j+14,:] = temp
+                pattern[1].pixel_array = pa
                 self.make_transparent(pattern[1])
                 pattern[1].set_color(random_bright_color())
                 self.added_patterns.add(pattern)
@@ -1545,7 +1548,9 @@ class BreakUpMacroPatterns(IntroduceEachLayer):
             mob.set_color(color)
             mob.save_state()
             mob.move_to(nine)
-        right_line[1].pixel_array[:14,:,3] = 0
+        pixel_array = np.array(right_line[1].pixel_array)
+        pixel_array[:14,:,3] = 0
+        right_line[1].pixel_array = pixel_array
 
         self.play(FadeIn(nine))
         self.wait()
@@ -1726,7 +1731,9 @@ class BreakUpMacroPatterns(IntroduceEachLayer):
             dtype = 'uint8'
         )
         image_mob.set_color(WHITE)
-        image_mob.pixel_array[:,:,3] = alpha_vect
+        pixel_array = np.array(image_mob.pixel_array)
+        pixel_array[:,:,3] = alpha_vect
+        image_mob.pixel_array = pixel_array
         return image_mob
 
 class GenerallyLoopyPattern(Scene):
@@ -1917,13 +1924,14 @@ class SecondLayerIsLittleEdgeLayer(IntroduceEachLayer):
         for i, j in it.product(list(range(n)), list(range(k))):
             mob = ImageMobject(np.zeros((28, 28, 4), dtype = 'uint8'))
             mob.replace(self.nine[1])
-            pa = mob.pixel_array
+            pa = np.array(mob.pixel_array)
             color = colors[(k*i + j)%(len(colors))]
             rgb = (255*color_to_rgb(color)).astype('uint8')
             pa[:,:,:3] = rgb
             i0, i1 = 1+(28/n)*i, 1+(28/n)*(i+1)
             j0, j1 = (28/k)*j, (28/k)*(j+1)
             pa[i0:i1,j0:j1,3] = nine_pa[i0:i1,j0:j1,3]
+            mob.pixel_array = pa
             self.edge_colored_nine.add(mob)
         self.edge_colored_nine.next_to(layers[1], UP)
 
@@ -1935,7 +1943,9 @@ class SecondLayerIsLittleEdgeLayer(IntroduceEachLayer):
             make_transparent(mob)
             mob.set_color(color)
             mob.replace(self.nine[1])
-        line.pixel_array[:14,:,:] = 0
+        pixel_array = np.array(line.pixel_array)
+        pixel_array[:14,:,:] = 0
+        line.pixel_array = pixel_array
 
         self.pattern_colored_nine = Group(loop, line)
         self.pattern_colored_nine.next_to(layers[2], UP)
@@ -1686,8 +1686,10 @@ class DefineComplexNumbersPurelyAlgebraically(Scene):
                     brace.get_bottom() + SMALL_BUFF * DOWN,
                     target.get_top() + MED_SMALL_BUFF * UP,
                 )
-                arrow.points[1] = arrow.points[0] + DOWN
-                arrow.points[2] = arrow.points[3] + UP
+                points = np.array(arrow.points)
+                points[1] = points[0] + DOWN
+                points[2] = points[3] + UP
+                arrow.points = points
                 tip = RegularPolygon(3, start_angle=-100 * DEGREES)
                 tip.set_height(0.2)
                 tip.set_stroke(width=0)
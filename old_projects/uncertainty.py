@@ -909,8 +909,10 @@ class TwoCarsAtRedLight(Scene):
         new_frequency_graph.match_color(self.frequency_graph)
 
         def pin_freq_graph_end_points(freq_graph):
-            freq_graph.points[0] = frequency_axes.coords_to_point(0, 0)
-            freq_graph.points[-1] = frequency_axes.coords_to_point(2, 0)
+            points = np.array(freq_graph.points)
+            points[0] = frequency_axes.coords_to_point(0, 0)
+            points[-1] = frequency_axes.coords_to_point(2, 0)
+            freq_graph.points = points
 
         self.play(LaggedStart(
             FadeOut, VGroup(
@@ -19,7 +19,6 @@ from utils.space_ops import project_along_vector
 from utils.space_ops import rotate_vector
 from utils.space_ops import z_to_vector
 
-from scipy.spatial import ConvexHull
 from traceback import *
 
 LIGHT_COLOR = YELLOW
@@ -553,6 +552,7 @@ class LightSource(VMobject):
 
         point_cloud_2d = rotated_point_cloud_3d[:, :2]
         # now we can compute the convex hull
+        from scipy.spatial import ConvexHull
         hull_2d = ConvexHull(point_cloud_2d)  # guaranteed to run ccw
         hull = []
 
@@ -0,0 +1,394 @@
+import hashlib
+import numpy as np
+import os
+import queue
+import shutil
+import subprocess as sp
+import threading
+
+from constants import *
+
+from utils.config_ops import digest_config
+
+
+class FrameSink(object):
+    """
+    Takes the frames of a scene, in order, and writes them out to
+    file_path.  Frames are handed to a writer thread through a bounded
+    queue, so encoding overlaps with rendering, and the scene only
+    waits when the writer has fallen queue_size frames behind.
+
+    Frames are written straight from their own memory rather than
+    copied, so they mustn't be changed after being passed in.
+    """
+    CONFIG = {
+        "queue_size": 8,
+    }
+    # Whether anything ends up at file_path
+    writes_file = True
+
+    def __init__(self, file_path, width, height, fps, **kwargs):
+        digest_config(self, kwargs, locals())
+        self.frame_queue = queue.Queue(maxsize=self.queue_size)
+        self.error = None
+        self.open()
+        self.writer_thread = threading.Thread(target=self.drain_queue)
+        self.writer_thread.daemon = True
+        self.writer_thread.start()
+
+    def open(self):
+        pass
+
+    def write_frame_data(self, frame):
+        raise Exception("Not implemented")
+
+    def finish(self):
+        pass
+
+    def write_frame(self, frame):
+        self.raise_writer_error()
+        self.frame_queue.put(frame)
+
+    def drain_queue(self):
+        while True:
+            frame = self.frame_queue.get()
+            if frame is None:
+                return
+            if self.error is not None:
+                # Keep emptying the queue so the scene never blocks
+                # on it, the error is raised on its next write
+                continue
+            try:
+                self.write_frame_data(frame)
+            except Exception as err:
+                self.error = err
+
+    def close(self):
+        self.frame_queue.put(None)
+        self.writer_thread.join()
+        self.finish()
+        self.raise_writer_error()
+
+    def raise_writer_error(self):
+        if self.error is not None:
+            raise Exception(
+                "Failed writing frames to %s: %s" % (
+                    self.file_path, self.error
+                )
+            )
+
+
+class FFMpegFrameSink(FrameSink):
+    CONFIG = {
+        # Output options for ffmpeg after the input
+        "codec_args": [
+            '-vcodec', 'libx264',
+            '-pix_fmt', 'yuv420p',
+        ],
+        "stream_to": None,
+    }
+
+    def open(self):
+        command = [
+            FFMPEG_BIN,
+            '-y',  # overwrite output file if it exists
+            '-f', 'rawvideo',
+            '-s', '%dx%d' % (self.width, self.height),  # size of one frame
+            '-pix_fmt', 'rgba',
+            '-r', str(self.fps),  # frames per second
+            '-i', '-',  # The imput comes from a pipe
+            '-an',  # Tells FFMPEG not to expect any audio
+            '-loglevel', 'error',
+        ]
+        command += self.codec_args
+        if self.stream_to is not None:
+            command += self.stream_to
+        else:
+            command += [self.file_path]
+        self.writing_process = sp.Popen(command, stdin=sp.PIPE)
+
+    def write_frame_data(self, frame):
+        self.writing_process.stdin.write(np.ascontiguousarray(frame).data)
+
+    def finish(self):
+        self.writing_process.stdin.close()
+        self.writing_process.wait()
+
+
+class NpyFrameSink(FrameSink):
+    """
+    Writes a .npy file holding an array of shape
+    (num_frames, height, width, 4), which np.load can memory map.
+    """
+    CONFIG = {
+        # Room for the header, which is rewritten once the
+        # number of frames is known
+        "header_length": 128,
+    }
+
+    def open(self):
+        self.num_frames = 0
+        self.file = open(self.file_path, "wb")
+        self.write_header()
+
+    def write_header(self):
+        header = "{'descr': '|u1', 'fortran_order': False, 'shape': %s, }" % (
+            str((self.num_frames, self.height, self.width, 4))
+        )
+        # Magic string, version 1.0, and the length of what follows
+        prefix = b"\x93NUMPY\x01\x00"
+        prefix += np.uint16(self.header_length).tobytes()
+        header = header.ljust(self.header_length - 1) + "\n"
+        self.file.seek(0)
+        self.file.write(prefix + header.encode("latin1"))
+
+    def write_frame_data(self, frame):
+        frame = np.ascontiguousarray(frame, dtype='uint8')
+        self.file.write(frame.data)
+        self.num_frames += 1
+
+    def finish(self):
+        self.write_header()
+        self.file.close()
+
+
+class Y4MFrameSink(FrameSink):
+    """
+    Writes uncompressed YUV 4:4:4 frames in the yuv4mpeg format,
+    which most players and encoders read directly.  The alpha
+    channel is dropped.
+    """
+
+    def open(self):
+        self.file = open(self.file_path, "wb")
+        self.file.write((
+            "YUV4MPEG2 W%d H%d F%d:1 Ip A1:1 C444\n" % (
+                self.width, self.height, self.fps
+            )
+        ).encode())
+
+    def write_frame_data(self, frame):
+        self.file.write(b"FRAME\n")
+        self.file.write(rgba_to_yuv444_planes(frame).data)
+
+    def finish(self):
+        self.file.close()
+
+
+class NullFrameSink(FrameSink):
+    """
+    Counts frames and drops them, for timing everything that goes
+    into a frame apart from encoding it.  Nothing is written, so no
+    writer thread is needed.
+
+    With checksum set, a blake2b digest of all frames is kept as
+    well, which is enough to tell whether two renders match.
+    """
+    CONFIG = {
+        "checksum": False,
+    }
+    writes_file = False
+
+    def __init__(self, file_path, width, height, fps, **kwargs):
+        digest_config(self, kwargs, locals())
+        self.num_frames = 0
+        self.hasher = hashlib.blake2b(digest_size=16)
+
+    def write_frame(self, frame):
+        if self.checksum:
+            self.hasher.update(np.ascontiguousarray(frame).data)
+        self.num_frames += 1
+
+    def get_checksum(self):
+        if not self.checksum:
+            return None
+        return self.hasher.hexdigest()
+
+    def close(self):
+        pass
+
+
+def get_frame_checksum(frame):
+    return hashlib.blake2b(
+        np.ascontiguousarray(frame).data, digest_size=16
+    ).hexdigest()
+
+
+def rgba_to_yuv444_planes(frame):
+    # BT.601, limited range
+    matrix = np.array([
+        [0.256788, 0.504129, 0.097906],
+        [-0.148223, -0.290993, 0.439216],
+        [0.439216, -0.367788, -0.071427],
+    ], dtype='float32')
+    offsets = np.array([16, 128, 128], dtype='float32')
+    rgb = frame[:, :, :3].astype('float32')
+    yuv = np.dot(rgb, matrix.T) + offsets
+    planes = np.rint(np.clip(yuv, 0, 255)).astype('uint8')
+    return np.ascontiguousarray(planes.transpose(2, 0, 1))
+
+
+ENCODER_PRESETS = {
+    "x264": {
+        "sink_class": FFMpegFrameSink,
+        "extension": ".mp4",
+        "config": {},
+    },
+    "x264_ultrafast": {
+        "sink_class": FFMpegFrameSink,
+        "extension": ".mp4",
+        "config": {
+            "codec_args": [
+                '-vcodec', 'libx264',
+                '-preset', 'ultrafast',
+                '-pix_fmt', 'yuv420p',
+            ],
+        },
+    },
+    "nvenc": {
+        "sink_class": FFMpegFrameSink,
+        "extension": ".mp4",
+        "config": {
+            "codec_args": [
+                '-vcodec', 'h264_nvenc',
+                '-pix_fmt', 'yuv420p',
+            ],
+        },
+    },
+    # Lossless, for intermediates
+    "ffv1": {
+        "sink_class": FFMpegFrameSink,
+        "extension": ".mkv",
+        "config": {
+            "codec_args": ['-vcodec', 'ffv1', '-level', '3'],
+        },
+    },
+    # Keeps transparency
+    "qtrle": {
+        "sink_class": FFMpegFrameSink,
+        "extension": ".mov",
+        "config": {
+            "codec_args": ['-vcodec', 'qtrle'],
+        },
+    },
+    "npy": {
+        "sink_class": NpyFrameSink,
+        "extension": ".npy",
+        "config": {},
+    },
+    "y4m": {
+        "sink_class": Y4MFrameSink,
+        "extension": ".y4m",
+        "config": {},
+    },
+    # Renders every frame, but writes nothing
+    "null": {
+        "sink_class": NullFrameSink,
+        "extension": ".null",
+        "config": {},
+    },
+}
+
+
+def get_encoder_preset(name):
+    if name not in ENCODER_PRESETS:
+        raise Exception(
+            "Unknown encoder preset %s, choose from %s" % (
+                name, ", ".join(sorted(ENCODER_PRESETS.keys()))
+            )
+        )
+    return ENCODER_PRESETS[name]
+
+
+def get_frame_sink(encoder_preset, file_path, width, height, fps, **kwargs):
+    preset = get_encoder_preset(encoder_preset)
+    config = dict(preset["config"])
+    config.update(kwargs)
+    return preset["sink_class"](file_path, width, height, fps, **config)
+
+
+class CombineMovieFilesError(Exception):
+    def __init__(self, message, unreadable_file_paths=()):
+        Exception.__init__(self, message)
+        self.unreadable_file_paths = list(unreadable_file_paths)
+
+
+def combine_movie_files(encoder_preset, file_paths, output_path):
+    """
+    Joins files written by the sink for encoder_preset, all of the
+    same frame size and rate, into one at output_path.
+    """
+    sink_class = get_encoder_preset(encoder_preset)["sink_class"]
+    if issubclass(sink_class, FFMpegFrameSink):
+        combine_movie_files_with_ffmpeg(file_paths, output_path)
+    elif issubclass(sink_class, NpyFrameSink):
+        arrays = [np.load(path, mmap_mode="r") for path in file_paths]
+        height, width = arrays[0].shape[1:3]
+        sink = NpyFrameSink(output_path, width, height, None)
+        for array in arrays:
+            for frame in array:
+                sink.write_frame(frame)
+        sink.close()
+    elif issubclass(sink_class, Y4MFrameSink):
+        with open(output_path, "wb") as output:
+            for count, path in enumerate(file_paths):
+                with open(path, "rb") as fp:
+                    header = fp.readline()
+                    if count == 0:
+                        output.write(header)
+                    shutil.copyfileobj(fp, output)
+    else:
+        raise Exception("Can't combine files from %s" % sink_class.__name__)
+
+
+def combine_movie_files_with_ffmpeg(file_paths, output_path):
+    list_file_path = os.path.join(
+        os.path.dirname(file_paths[0]),
+        "partial_movie_file_list.txt"
+    )
+    with open(list_file_path, "w") as fp:
+        for file_path in file_paths:
+            # Relative paths would be read as relative to the list file
+            file_path = os.path.abspath(file_path)
+            fp.write("file '%s'\n" % file_path.replace("'", "'\\''"))
+    command = [
+        FFMPEG_BIN,
+        '-y',  # overwrite output file if it exists
+        '-f', 'concat',
+        '-safe', '0',
+        '-i', list_file_path,
+        '-c', 'copy',
+        '-an',
+        '-loglevel', 'error',
+        output_path,
+    ]
+    if sp.call(command) != 0:
+        unreadable_file_paths = [
+            file_path
+            for file_path in file_paths
+            if not is_readable_movie_file(file_path)
+        ]
+        message = "ffmpeg failed to combine the files listed in %s" % (
+            list_file_path
+        )
+        if unreadable_file_paths:
+            message += ", of which these can't be read:\n" + "\n".join(
+                unreadable_file_paths
+            )
+        raise CombineMovieFilesError(message, unreadable_file_paths)
+
+
+def is_readable_movie_file(file_path):
+    # Decodes every frame, as a truncated or corrupted
+    # file can still have a readable header
+    command = [
+        FFMPEG_BIN,
+        '-loglevel', 'error',
+        '-xerror',
+        '-i', file_path,
+        '-f', 'null',
+        '-',
+    ]
+    return sp.call(
+        command, stdin=sp.DEVNULL, stdout=sp.DEVNULL, stderr=sp.DEVNULL
+    ) == 0
@@ -0,0 +1,97 @@
+import numpy as np
+import tempfile
+
+from utils.config_ops import digest_config
+
+
+class FrameSpool(object):
+    """
+    Holds the frames a scene keeps with save_frames in a temporary
+    file rather than in memory, and hands them back by index, as
+    read-only memory-mapped arrays, so only the frames being looked
+    at take up memory.
+
+    A frame identical to the one before it, as is every frame of a
+    wait call, is stored once, with both indices referring to the
+    same place in the file.  Like frame sinks, this holds on to the
+    last frame passed in to compare with, so frames mustn't be
+    changed after being added.
+    """
+    CONFIG = {
+        # Where the spool file goes, the system's temporary
+        # directory if None.  It is deleted once closed.
+        "directory": None,
+    }
+
+    def __init__(self, **kwargs):
+        digest_config(self, kwargs)
+        self.file = None
+        self.clear()
+
+    def clear(self):
+        self.end_offset = 0
+        # (offset, shape, dtype) of each distinct frame in the file
+        self.slots = []
+        # Index into slots for each frame added
+        self.frame_slots = []
+        self.last_frame = None
+
+    def __len__(self):
+        return len(self.frame_slots)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        offset, shape, dtype = self.slots[self.frame_slots[index]]
+        self.file.flush()
+        return np.memmap(
+            self.file, dtype=dtype, mode="r",
+            offset=offset, shape=shape,
+        )
+
+    def add_frames(self, *frames):
+        for frame in frames:
+            if self.is_same_as_last_frame(frame):
+                self.frame_slots.append(len(self.slots) - 1)
+            else:
+                self.write_frame(frame)
+        return self
+
+    def is_same_as_last_frame(self, frame):
+        last_frame = self.last_frame
+        if last_frame is None:
+            return False
+        if frame is last_frame:
+            return True
+        return frame.dtype == last_frame.dtype and \
+            np.array_equal(frame, last_frame)
+
+    def write_frame(self, frame):
+        frame = np.ascontiguousarray(frame)
+        if self.file is None:
+            self.file = tempfile.TemporaryFile(
+                prefix="frames_", suffix=".spool", dir=self.directory
+            )
+        # Reading may have moved the file position
+        self.file.seek(self.end_offset)
+        self.file.write(frame.data.cast("B"))
+        self.slots.append((self.end_offset, frame.shape, frame.dtype))
+        self.frame_slots.append(len(self.slots) - 1)
+        self.end_offset += frame.nbytes
+        self.last_frame = frame
+
+    def get_num_stored_frames(self):
+        return len(self.slots)
+
+    def get_num_stored_bytes(self):
+        return self.end_offset
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+        self.clear()
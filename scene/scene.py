@@ -1,12 +1,15 @@
 
 import inspect
 import itertools as it
+import json
+import multiprocessing as mp
 import numpy as np
 import os
 import random
 import shutil
 import subprocess as sp
 import warnings
+from collections import deque
 from time import sleep
 try:
     import thread  # Low-level threading API (Python 2.7)
@@ -22,10 +25,19 @@ from animation.transform import MoveToTarget, ApplyMethod
 from camera.camera import Camera
 from continual_animation.continual_animation import ContinualAnimation
 from mobject.mobject import Mobject
+from scene.frame_sinks import CombineMovieFilesError
+from scene.frame_sinks import combine_movie_files
+from scene.frame_sinks import get_encoder_preset
+from scene.frame_sinks import get_frame_checksum
+from scene.frame_sinks import get_frame_sink
+from scene.frame_spool import FrameSpool
+from utils.hashing import get_hash_from_objects
 from utils.iterables import list_update
 from utils.output_directory_getters import add_extension_if_not_present
 from utils.output_directory_getters import get_movie_output_directory
 from utils.output_directory_getters import get_image_output_directory
+from utils.output_directory_getters import guarantee_existance
+from utils.profiling import PROFILER
 
 from container.container import Container
 
@@ -46,11 +58,40 @@ class Scene(Container):
         "save_pngs": False,
         "pngs_mode": "RGBA",
         "movie_file_extension": ".mp4",
+        # One of the names in frame_sinks.ENCODER_PRESETS, which then
+        # sets movie_file_extension.  If None, this is qtrle for .mov
+        # files and x264 otherwise.
+        "encoder_preset": None,
+        # Options for the frame sink, e.g. {"checksum": True}
+        # with the null encoder preset
+        "frame_sink_config": {},
         "name": None,
         "always_continually_update": False,
         "random_seed": 0,
         "start_at_animation_number": None,
         "end_at_animation_number": None,
+        # If greater than 1, frames of each play call are rendered
+        # by a pool of this many forked processes
+        "num_frame_processes": 1,
+        # Bounds how many rendered frames each of those processes
+        # can have waiting to be written
+        "max_frames_in_flight_per_process": 4,
+        # Write each play and wait call to its own movie file, named
+        # by a hash of everything that goes into it, and reuse those
+        # files on later runs rather than re-rendering
+        "use_partial_movie_cache": False,
+        # Time each stage of rendering every frame, printing a
+        # summary after each play call and writing reports next
+        # to the movie file
+        "profile_render": False,
+        # Record a checksum of every frame, by play and wait call, and
+        # write them to a manifest next to the movie file, or check
+        # them against the manifest from an earlier run
+        "write_frame_manifest": False,
+        "check_frame_manifest": False,
+        # Options for the FrameSpool holding frames when save_frames
+        # is set, e.g. {"directory": ...}
+        "frame_spool_config": {},
     }
 
     def __init__(self, **kwargs):
@@ -61,20 +102,40 @@ class Scene(Container):
         self.continual_animations = []
         self.foreground_mobjects = []
         self.num_plays = 0
-        self.saved_frames = []
+        self.saved_frames = FrameSpool(**self.frame_spool_config)
         self.shared_locals = {}
         self.frame_num = 0
+        self.num_frames = 0
         self.current_scene_time = 0
         self.original_skipping_status = self.skip_animations
         self.stream_lock = False
+        self.partial_movie_files = []
+        self.frame_manifest = []
+        self.skipping_cached_segment = False
+        self.writing_partial_movie = False
+        self.segment_start_num_frames = 0
         if self.name is None:
             self.name = self.__class__.__name__
+        if self.encoder_preset is None:
+            if self.movie_file_extension == ".mov":
+                self.encoder_preset = "qtrle"
+            else:
+                self.encoder_preset = "x264"
+        else:
+            preset = get_encoder_preset(self.encoder_preset)
+            self.movie_file_extension = preset["extension"]
+            if not preset["sink_class"].writes_file:
+                # No movie files to cache
+                self.use_partial_movie_cache = False
         if self.random_seed is not None:
             random.seed(self.random_seed)
             np.random.seed(self.random_seed)
+        if self.profile_render:
+            PROFILER.reset()
+            PROFILER.enable()
 
         self.setup()
-        if self.write_to_movie:
+        if self.write_to_movie and not self.use_partial_movie_cache:
             self.open_movie_pipe()
         if IS_LIVE_STREAMING:
             return None
@@ -89,7 +150,16 @@ class Scene(Container):
         self.wait(self.frame_duration)
 
         if self.write_to_movie:
-            self.close_movie_pipe()
+            if self.use_partial_movie_cache:
+                self.combine_partial_movie_files()
+            else:
+                self.close_movie_pipe()
+        if self.profile_render:
+            self.write_profile_reports()
+        if self.check_frame_manifest:
+            self.check_frames_against_manifest()
+        if self.write_frame_manifest:
+            self.write_frame_manifest_file()
         print("Played a total of %d animations" % self.num_plays)
 
     def setup(self):
@@ -169,12 +239,18 @@ class Scene(Container):
                 self.mobjects,
                 self.foreground_mobjects,
             )
+        kwargs["include_submobjects"] = include_submobjects
+        if background is None and not kwargs.get("excluded_mobjects"):
+            # Full redraw, as when waiting or streaming, so let the
+            # camera reuse its image of whatever hasn't changed
+            self.camera.capture_mobjects_over_static_layer(
+                mobjects, **kwargs
+            )
+            return
         if background is not None:
             self.set_camera_pixel_array(background)
         else:
             self.reset_camera()
-
-        kwargs["include_submobjects"] = include_submobjects
         self.capture_mobjects_in_camera(mobjects, **kwargs)
 
     def freeze_background(self):
@@ -184,10 +260,12 @@ class Scene(Container):
     ###
 
     def continual_update(self, dt):
-        for mobject in self.get_mobject_family_members():
-            mobject.update(dt)
-        for continual_animation in self.continual_animations:
-            continual_animation.update(dt)
+        with PROFILER.stage("mobject_updaters"):
+            for mobject in self.get_mobject_family_members():
+                mobject.update(dt)
+        with PROFILER.stage("continual_animations"):
+            for continual_animation in self.continual_animations:
+                continual_animation.update(dt)
 
     def wind_down(self, *continual_animations, **kwargs):
         wind_down_time = kwargs.get("wind_down_time", 1)
@@ -479,28 +557,47 @@ class Scene(Container):
             # scene gets added to the scene
             if animation.mobject not in self.get_mobject_family_members():
                 self.add(animation.mobject)
-        moving_mobjects = self.get_moving_mobjects(*animations)
+        self.begin_movie_segment(animations)
+        time_progression = self.get_animation_time_progression(animations)
+        self.begin_render_segment(time_progression.desc.rstrip(": "))
+        with PROFILER.stage("get_moving_mobjects"):
+            moving_mobjects = self.get_moving_mobjects(*animations)
 
         # Paint all non-moving objects onto the screen, so they don't
         # have to be rendered every frame
-        self.update_frame(excluded_mobjects=moving_mobjects)
-        static_image = self.get_frame()
-        total_run_time = 0
-        for t in self.get_animation_time_progression(animations):
-            for animation in animations:
-                animation.update(t / animation.run_time)
-            self.continual_update(dt=t - total_run_time)
-            self.update_frame(moving_mobjects, static_image)
-            self.add_frames(self.get_frame())
-            total_run_time = t
+        with PROFILER.stage("static_image"):
+            self.update_frame(excluded_mobjects=moving_mobjects)
+            static_image = self.get_frame()
+        if self.should_render_frames_in_parallel():
+            with PROFILER.stage("render_frames_in_parallel"):
+                total_run_time = self.play_frames_in_parallel(
+                    animations, moving_mobjects, static_image,
+                    time_progression
+                )
+        else:
+            total_run_time = 0
+            for t in time_progression:
+                PROFILER.begin_frame()
+                frame = self.get_animation_frame(
+                    animations, moving_mobjects, static_image,
+                    t, dt=t - total_run_time
+                )
+                self.add_frames(frame)
+                PROFILER.end_frame()
+                total_run_time = t
         self.mobjects_from_last_animation = [
             anim.mobject for anim in animations
         ]
-        self.clean_up_animations(*animations)
-        if self.skip_animations:
-            self.continual_update(total_run_time)
-        else:
-            self.continual_update(0)
+        with PROFILER.stage("clean_up"):
+            self.clean_up_animations(*animations)
+            if self.skip_animations:
+                self.continual_update(total_run_time)
+            else:
+                self.continual_update(0)
+        if self.profile_render:
+            PROFILER.print_segment_summary()
+        self.end_render_segment()
+        self.end_movie_segment()
         self.num_plays += 1
 
         if IS_LIVE_STREAMING:
@@ -509,6 +606,73 @@ class Scene(Container):
 
         return self
 
+    def get_animation_frame(self, animations, moving_mobjects, static_image, t, dt):
+        with PROFILER.stage("animation_update"):
+            for animation in animations:
+                animation.update(t / animation.run_time)
+        with PROFILER.stage("continual_update"):
+            self.continual_update(dt=dt)
+        with PROFILER.stage("update_frame"):
+            self.update_frame(moving_mobjects, static_image)
+        return self.get_frame()
+
+    def should_render_frames_in_parallel(self):
+        """
+        Frames can only be farmed out to other processes when
+        each one is determined by its time alone, which is not
+        the case when something needs to be continually updated
+        """
+        return all([
+            self.num_frame_processes > 1,
+            not self.skip_animations,
+            not IS_LIVE_STREAMING,
+            not self.should_continually_update(),
+            "fork" in mp.get_all_start_methods(),
+        ])
+
+    def play_frames_in_parallel(self, animations, moving_mobjects,
+                                static_image, time_progression):
+        """
+        Each worker is forked with a copy of the scene as it stands
+        at the start of this play call, so it can render any frame
+        by updating its animations to the corresponding alpha.
+        Frames come back in order, and are written from here.  Only
+        a few frames per worker are requested ahead of the one being
+        written, so frames don't pile up in memory when writing is
+        slower than rendering.
+        """
+        global PARALLEL_RENDER_STATE
+        PARALLEL_RENDER_STATE = (
+            self, animations, moving_mobjects, static_image
+        )
+        times = list(time_progression.iterable)
+        max_in_flight = self.max_frames_in_flight_per_process * \
+            self.num_frame_processes
+        context = mp.get_context("fork")
+        pool = context.Pool(self.num_frame_processes)
+        try:
+            pending = deque()
+            time_iter = iter(times)
+            for t in it.islice(time_iter, max_in_flight):
+                pending.append(pool.apply_async(
+                    render_frame_in_subprocess, (t,)
+                ))
+            for t in time_progression:
+                frame = pending.popleft().get()
+                next_t = next(time_iter, None)
+                if next_t is not None:
+                    pending.append(pool.apply_async(
+                        render_frame_in_subprocess, (next_t,)
+                    ))
+                self.add_frames(frame)
+        finally:
+            pool.terminate()
+            pool.join()
+            PARALLEL_RENDER_STATE = None
+        if len(times) == 0:
+            return 0
+        return times[-1]
+
     def idle_stream(self):
         while(self.stream_lock):
             a = datetime.datetime.now()
@@ -532,21 +696,29 @@ class Scene(Container):
         return []
 
     def wait(self, duration=DEFAULT_WAIT_TIME):
+        self.begin_movie_segment("wait", duration)
+        self.begin_render_segment("Wait %d: %gs" % (self.num_plays, duration))
         if self.should_continually_update():
             total_time = 0
             for t in self.get_time_progression(duration):
-                self.continual_update(dt=t - total_time)
-                self.update_frame()
+                PROFILER.begin_frame()
+                with PROFILER.stage("continual_update"):
+                    self.continual_update(dt=t - total_time)
+                with PROFILER.stage("update_frame"):
+                    self.update_frame()
                 self.add_frames(self.get_frame())
+                PROFILER.end_frame()
                 total_time = t
-        elif self.skip_animations:
-            # Do nothing
-            return self
-        else:
-            self.update_frame()
+        elif not self.skip_animations:
+            PROFILER.begin_frame()
+            with PROFILER.stage("update_frame"):
+                self.update_frame()
             n_frames = int(duration / self.frame_duration)
             frame = self.get_frame()
             self.add_frames(*[frame] * n_frames)
+            PROFILER.end_frame()
+        self.end_render_segment()
+        self.end_movie_segment()
         return self
 
     def wait_to(self, time, assert_positive=True):
@@ -573,16 +745,27 @@ class Scene(Container):
     def add_frames(self, *frames):
         if self.skip_animations:
             return
-        self.current_scene_time += len(frames) * self.frame_duration
+        self.advance_scene_clock(len(frames))
+        if self.is_recording_frame_manifest():
+            self.add_frames_to_manifest(frames)
         if self.write_to_movie:
             for frame in frames:
                 if self.save_pngs:
                     self.save_image(
                         "frame" + str(self.frame_num), self.pngs_mode, True)
                     self.frame_num = self.frame_num + 1
-                self.writing_process.stdin.write(frame.tostring())
+                # Includes waiting on the sink when its writer
+                # has fallen behind
+                with PROFILER.stage("write_frame"):
+                    self.frame_sink.write_frame(frame)
         if self.save_frames:
-            self.saved_frames += list(frames)
+            self.saved_frames.add_frames(*frames)
+
+    def advance_scene_clock(self, num_frames):
+        # Worked out from the frame count rather than summed, so it
+        # doesn't depend on how many frames were added at a time
+        self.num_frames += num_frames
+        self.current_scene_time = self.num_frames * self.frame_duration
 
     # Display methods
 
@@ -619,55 +802,42 @@ class Scene(Container):
             file_path += extension
         return file_path
 
-    def open_movie_pipe(self):
-        name = str(self)
-        file_path = self.get_movie_file_path(name)
-        temp_file_path = file_path.replace(name, name + "Temp")
-        print("Writing to %s" % temp_file_path)
+    def get_temp_file_path(self, file_path):
+        root, extension = os.path.splitext(file_path)
+        return root + "Temp" + extension
+
+    def open_movie_pipe(self, file_path=None):
+        preset = get_encoder_preset(self.encoder_preset)
+        if file_path is None:
+            file_path = self.get_movie_file_path()
+            if preset["sink_class"].writes_file:
+                print("Writing to %s" % self.get_temp_file_path(file_path))
+        temp_file_path = self.get_temp_file_path(file_path)
         self.args_to_rename_file = (temp_file_path, file_path)
 
         fps = int(1 / self.frame_duration)
         height = self.camera.get_pixel_height()
         width = self.camera.get_pixel_width()
 
-        command = [
-            FFMPEG_BIN,
-            '-y',  # overwrite output file if it exists
-            '-f', 'rawvideo',
-            '-s', '%dx%d' % (width, height),  # size of one frame
-            '-pix_fmt', 'rgba',
-            '-r', str(fps),  # frames per second
-            '-i', '-',  # The imput comes from a pipe
-            '-c:v', 'h264_nvenc',
-            '-an',  # Tells FFMPEG not to expect any audio
-            '-loglevel', 'error',
-        ]
-        if self.movie_file_extension == ".mov":
-            # This is if the background of the exported video
-            # should be transparent.
-            command += [
-                '-vcodec', 'qtrle',
-            ]
-        else:
-            command += [
-                '-vcodec', 'libx264',
-                '-pix_fmt', 'yuv420p',
-            ]
+        sink_config = dict(self.frame_sink_config)
         if IS_LIVE_STREAMING:
             if IS_STREAMING_TO_TWITCH:
-                command += ['-f', 'flv']
-                command += ['rtmp://live.twitch.tv/app/' + TWITCH_STREAM_KEY]
+                stream_to = ['-f', 'flv']
+                stream_to += ['rtmp://live.twitch.tv/app/' + TWITCH_STREAM_KEY]
             else:
-                command += ['-f', 'mpegts']
-                command += [STREAMING_PROTOCOL + '://' + STREAMING_IP + ':' + STREAMING_PORT]
-        else:
-            command += [temp_file_path]
-        # self.writing_process = sp.Popen(command, stdin=sp.PIPE, shell=True)
-        self.writing_process = sp.Popen(command, stdin=sp.PIPE)
+                stream_to = ['-f', 'mpegts']
+                stream_to += [STREAMING_PROTOCOL + '://' + STREAMING_IP + ':' + STREAMING_PORT]
+            sink_config["stream_to"] = stream_to
+        self.frame_sink = get_frame_sink(
+            self.encoder_preset, temp_file_path, width, height, fps,
+            **sink_config
+        )
 
     def close_movie_pipe(self):
-        self.writing_process.stdin.close()
-        self.writing_process.wait()
+        self.frame_sink.close()
+        if not self.frame_sink.writes_file:
+            self.print_null_output_summary()
+            return True
         if IS_LIVE_STREAMING:
             return True
         if os.name == 'nt':
@@ -675,6 +845,264 @@ class Scene(Container):
         else:
             os.rename(*self.args_to_rename_file)
 
+    def write_profile_reports(self):
+        PROFILER.disable()
+        file_path_root = self.get_movie_file_path(
+            name=self.name + "_profile", extension=""
+        )
+        for file_path in PROFILER.write_reports(file_path_root):
+            print("Wrote render profile to %s" % file_path)
+
+    def print_null_output_summary(self):
+        sink = self.frame_sink
+        message = "Rendered %d frames without writing them" % sink.num_frames
+        checksum = sink.get_checksum()
+        if checksum is not None:
+            message += ", checksum %s" % checksum
+        print(message)
+
+    # Render segments, one per play or wait call
+
+    def begin_render_segment(self, name):
+        PROFILER.begin_segment(name)
+        if self.is_recording_frame_manifest():
+            self.frame_manifest.append({"name": name, "checksums": []})
+
+    def end_render_segment(self):
+        PROFILER.end_segment()
+
+    # Frame manifests
+
+    def is_recording_frame_manifest(self):
+        return self.write_frame_manifest or self.check_frame_manifest
+
+    def add_frames_to_manifest(self, frames):
+        if len(self.frame_manifest) == 0:
+            self.frame_manifest.append({
+                "name": "Outside play and wait calls",
+                "checksums": [],
+            })
+        checksums = self.frame_manifest[-1]["checksums"]
+        if checksums is None:
+            return
+        # Waits repeat one frame many times
+        checksums_by_id = {}
+        for frame in frames:
+            if id(frame) not in checksums_by_id:
+                checksums_by_id[id(frame)] = get_frame_checksum(frame)
+            checksums.append(checksums_by_id[id(frame)])
+
+    def get_frame_manifest_file_path(self):
+        return self.get_movie_file_path(
+            name=self.name + "_frames", extension=".json"
+        )
+
+    def write_frame_manifest_file(self):
+        file_path = self.get_frame_manifest_file_path()
+        with open(file_path, "w") as fp:
+            json.dump({
+                "scene": self.name,
+                "segments": self.frame_manifest,
+            }, fp, indent=1)
+        print("Wrote frame checksums to %s" % file_path)
+
+    def check_frames_against_manifest(self):
+        file_path = self.get_frame_manifest_file_path()
+        if not os.path.exists(file_path):
+            print("No frame manifest at %s to check against" % file_path)
+            return None
+        with open(file_path) as fp:
+            expected_segments = json.load(fp)["segments"]
+        difference = self.get_first_manifest_difference(expected_segments)
+        if difference is None:
+            num_unchecked = len([
+                segment for segment in self.frame_manifest
+                if segment["checksums"] is None
+            ])
+            message = "All frames match %s" % file_path
+            if num_unchecked > 0:
+                message += ", apart from %d cached segments without checksums" % (
+                    num_unchecked
+                )
+            print(message)
+        else:
+            print("Frames differ from %s: %s" % (file_path, difference))
+        return difference
+
+    def get_first_manifest_difference(self, expected_segments):
+        """
+        Describes the first frame where this render departs from
+        expected_segments, or returns None if there is no such frame.
+        Segments whose checksums are unknown, as for cached partial
+        movies written without them, are passed over.
+        """
+        segment_pairs = zip(expected_segments, self.frame_manifest)
+        for index, (expected, actual) in enumerate(segment_pairs):
+            if expected["name"] != actual["name"]:
+                return "segment %d is %s, but was %s" % (
+                    index, actual["name"], expected["name"]
+                )
+            if expected["checksums"] is None or actual["checksums"] is None:
+                continue
+            checksum_pairs = zip(expected["checksums"], actual["checksums"])
+            for frame_index, (c1, c2) in enumerate(checksum_pairs):
+                if c1 != c2:
+                    return "%s, frame %d" % (actual["name"], frame_index)
+            if len(expected["checksums"]) != len(actual["checksums"]):
+                return "%s has %d frames, but had %d" % (
+                    actual["name"],
+                    len(actual["checksums"]),
+                    len(expected["checksums"]),
+                )
+        if len(expected_segments) != len(self.frame_manifest):
+            return "%d play and wait calls, but there were %d" % (
+                len(self.frame_manifest), len(expected_segments)
+            )
+        return None
+
+    # Partial movie caching
+
+    def is_caching_partial_movies(self):
+        return all([
+            self.write_to_movie,
+            self.use_partial_movie_cache,
+            not self.skip_animations,
+            not IS_LIVE_STREAMING,
+        ])
+
+    def get_segment_hash(self, *segment_args):
+        # Drop what the camera only uses as scratch space
+        # while drawing a frame
+        camera_state = dict(self.camera.__dict__)
+        for key in ["pixel_array", "pixel_array_to_cairo_context",
+                    "background_colored_vmobject_displayer",
+                    "static_layer"]:
+            camera_state.pop(key, None)
+        return get_hash_from_objects(
+            segment_args,
+            self.mobjects,
+            self.foreground_mobjects,
+            self.continual_animations,
+            camera_state,
+            self.frame_duration,
+            self.movie_file_extension,
+            self.encoder_preset,
+            random.getstate(),
+            np.random.get_state(),
+            ignored_objects=[self, self.camera],
+        )
+
+    def get_partial_movie_directory(self):
+        return guarantee_existance(os.path.join(
+            os.path.dirname(self.get_movie_file_path()),
+            "partial_movie_files",
+            str(self),
+        ))
+
+    def begin_movie_segment(self, *segment_args):
+        """
+        If a partial movie file for the state of the scene and the
+        arguments of this play/wait call already exists, the call is
+        run with animations skipped and that file gets reused.
+        Otherwise its frames are written to a new such file.
+
+        The scene clock, and so wait_to and the numbering of saved
+        pngs, still moves on by the length of a reused segment.
+
+        Note, a reused segment leaves the scene in the state it would
+        be in after skipping the animations, so anything evolving with
+        time-based updaters may come out differently than if rendered,
+        in which case later segments will simply miss the cache.
+        """
+        if not self.is_caching_partial_movies():
+            return
+        file_path = os.path.join(
+            self.get_partial_movie_directory(),
+            self.get_segment_hash(*segment_args) + self.movie_file_extension
+        )
+        self.partial_movie_files.append(file_path)
+        # The frame count is only written once the movie file is
+        # complete, so a file left by an interrupted run isn't reused
+        if os.path.exists(file_path) and \
+                os.path.exists(self.get_partial_movie_info_file_path()):
+            self.skipping_cached_segment = True
+            self.skip_animations = True
+        else:
+            self.writing_partial_movie = True
+            self.segment_start_num_frames = self.num_frames
+            self.open_movie_pipe(file_path)
+
+    def end_movie_segment(self):
+        if self.skipping_cached_segment:
+            self.skipping_cached_segment = False
+            self.skip_animations = False
+            info = self.load_partial_movie_info()
+            num_frames = info["num_frames"]
+            if self.write_to_movie and self.save_pngs:
+                self.frame_num += num_frames
+            self.advance_scene_clock(num_frames)
+            if self.is_recording_frame_manifest():
+                self.load_partial_movie_checksums()
+        elif self.writing_partial_movie:
+            self.writing_partial_movie = False
+            self.close_movie_pipe()
+            self.save_partial_movie_info({
+                "num_frames": self.num_frames - self.segment_start_num_frames,
+            })
+            if self.is_recording_frame_manifest():
+                self.save_partial_movie_checksums()
+
+    def get_partial_movie_info_file_path(self):
+        return self.partial_movie_files[-1] + ".json"
+
+    def save_partial_movie_info(self, info):
+        with open(self.get_partial_movie_info_file_path(), "w") as fp:
+            json.dump(info, fp)
+
+    def load_partial_movie_info(self):
+        with open(self.get_partial_movie_info_file_path()) as fp:
+            return json.load(fp)
+
+    def get_partial_movie_checksums_file_path(self):
+        return self.partial_movie_files[-1] + ".frames.json"
+
+    def save_partial_movie_checksums(self):
+        with open(self.get_partial_movie_checksums_file_path(), "w") as fp:
+            json.dump(self.frame_manifest[-1]["checksums"], fp)
+
+    def load_partial_movie_checksums(self):
+        file_path = self.get_partial_movie_checksums_file_path()
+        if os.path.exists(file_path):
+            with open(file_path) as fp:
+                checksums = json.load(fp)
+        else:
+            checksums = None
+        self.frame_manifest[-1]["checksums"] = checksums
+
+    def combine_partial_movie_files(self):
+        file_path = self.get_movie_file_path()
+        temp_file_path = self.get_temp_file_path(file_path)
+        print("Combining %d partial movie files into %s" % (
+            len(self.partial_movie_files), file_path
+        ))
+        try:
+            combine_movie_files(
+                self.encoder_preset, self.partial_movie_files, temp_file_path
+            )
+        except CombineMovieFilesError as error:
+            # So the next run renders these segments again rather
+            # than failing on the same files
+            for partial_file_path in error.unreadable_file_paths:
+                self.remove_partial_movie_file(partial_file_path)
+            raise
+        shutil.move(temp_file_path, file_path)
+
+    def remove_partial_movie_file(self, file_path):
+        for extension in ["", ".json", ".frames.json"]:
+            path = file_path + extension
+            if os.path.exists(path):
+                os.remove(path)
+
     def tex(self, latex):
         eq = TextMobject(latex)
         anims = []
@@ -684,5 +1112,16 @@ class Scene(Container):
         self.play(*anims)
 
 
+# Set by Scene.play_frames_in_parallel just before forking
+PARALLEL_RENDER_STATE = None
+
+
+def render_frame_in_subprocess(t):
+    scene, animations, moving_mobjects, static_image = PARALLEL_RENDER_STATE
+    return scene.get_animation_frame(
+        animations, moving_mobjects, static_image, t, dt=0
+    )
+
+
 class EndSceneEarlyException(Exception):
     pass
@@ -1,11 +1,12 @@
 
 
 
-import cv2
-
 from tqdm import tqdm as show_progress
 
 from scene.scene import Scene
+from utils.lazy_imports import lazy_import
+
+cv2 = lazy_import("cv2")
 
 
 class SceneFromVideo(Scene):
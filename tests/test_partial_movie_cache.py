@@ -0,0 +1,69 @@
+import numpy as np
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from big_ol_pile_of_manim_imports import *
+
+
+class WaitToScene(Scene):
+    CONFIG = {
+        "write_to_movie": True,
+        "use_partial_movie_cache": True,
+        "encoder_preset": "npy",
+        "save_pngs": True,
+    }
+
+    def construct(self):
+        self.timeline = []
+        dot = Dot()
+        self.add(dot)
+        self.wait(0.5)
+        self.timeline.append(self.current_scene_time)
+        self.play(dot.shift, RIGHT, run_time=0.5)
+        self.timeline.append(self.current_scene_time)
+        self.wait_to(2)
+        self.timeline.append(self.current_scene_time)
+        self.play(dot.shift, LEFT, run_time=0.5)
+        self.timeline.append(self.current_scene_time)
+
+
+class PartialMovieCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        for name in ["get_movie_output_directory",
+                     "get_image_output_directory"]:
+            patcher = mock.patch(
+                "scene.scene." + name,
+                lambda *args, **kwargs: self.directory
+            )
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def render(self):
+        scene = WaitToScene()
+        frames = np.load(scene.get_movie_file_path())
+        return scene, frames
+
+    def test_reused_segments_keep_the_timeline(self):
+        cold_scene, cold_frames = self.render()
+        partial_movie_directory = cold_scene.get_partial_movie_directory()
+        cold_files = sorted(os.listdir(partial_movie_directory))
+        warm_scene, warm_frames = self.render()
+        # Every segment was reused rather than written again
+        self.assertEqual(
+            cold_files, sorted(os.listdir(partial_movie_directory))
+        )
+        self.assertEqual(cold_scene.timeline, warm_scene.timeline)
+        self.assertAlmostEqual(cold_scene.timeline[2], 2)
+        self.assertEqual(cold_scene.num_frames, warm_scene.num_frames)
+        self.assertEqual(cold_scene.frame_num, warm_scene.frame_num)
+        self.assertEqual(cold_scene.num_frames, len(cold_frames))
+        self.assertTrue(np.array_equal(cold_frames, warm_frames))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import numpy as np
+import os
+import shutil
+import tempfile
+import unittest
+
+from PIL import Image
+
+from big_ol_pile_of_manim_imports import *
+
+
+class StaticLayerTest(unittest.TestCase):
+    def setUp(self):
+        self.camera = Camera(**LOW_QUALITY_CAMERA_CONFIG)
+
+    def capture(self, mobjects):
+        self.camera.capture_mobjects_over_static_layer(mobjects)
+        return np.array(self.camera.pixel_array)
+
+    def fresh_capture(self, mobjects):
+        camera = Camera(**LOW_QUALITY_CAMERA_CONFIG)
+        camera.capture_mobjects(mobjects)
+        return np.array(camera.pixel_array)
+
+    def test_changed_subpath_is_redrawn(self):
+        square = Square(fill_opacity=1)
+        subpath = square.add_subpath(0.5 * square.points)
+        circle = Circle()
+        mobjects = [square, circle]
+        self.capture(mobjects)
+        self.capture(mobjects)
+        # The subpath is among the mobjects displayed, after the square
+        self.assertEqual(self.camera.static_layer["size"], 3)
+
+        fingerprint = self.camera.get_mobject_display_fingerprint(square)
+        subpath.shift(0.25 * RIGHT)
+        self.assertNotEqual(
+            fingerprint,
+            self.camera.get_mobject_display_fingerprint(square),
+        )
+        pixels = self.capture(mobjects)
+        self.assertEqual(self.camera.static_layer["size"], 0)
+        self.assertTrue(np.array_equal(pixels, self.fresh_capture(mobjects)))
+
+    def test_points_are_fingerprinted_by_identity(self):
+        square = Square()
+        fingerprint = self.camera.get_mobject_display_fingerprint(square)
+        self.assertEqual(
+            fingerprint,
+            self.camera.get_mobject_display_fingerprint(square),
+        )
+        square.points = np.array(square.points)
+        self.assertNotEqual(
+            fingerprint,
+            self.camera.get_mobject_display_fingerprint(square),
+        )
+
+    def test_background_colored_batch_is_not_split(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        image_path = os.path.join(directory, "gradient.png")
+        Image.fromarray(
+            np.linspace(0, 255, 64 * 64 * 3).astype('uint8').reshape(
+                (64, 64, 3)
+            )
+        ).save(image_path)
+        squares = [
+            Square(fill_opacity=1).color_using_background_image(image_path)
+            for x in range(3)
+        ]
+        self.capture(squares)
+        self.capture(squares)
+        self.assertEqual(self.camera.static_layer["size"], 3)
+        squares[2].shift(RIGHT)
+        self.capture(squares)
+        self.assertEqual(self.camera.static_layer["size"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
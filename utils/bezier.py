@@ -1,18 +1,68 @@
 import numpy as np
+from functools import lru_cache
 
-from scipy import linalg
+from utils.lazy_imports import lazy_import
 from utils.simple_functions import choose_using_cache
 from utils.space_ops import get_norm
 
+linalg = lazy_import("scipy.linalg")
+
 CLOSED_THRESHOLD = 0.001
 
 
 def bezier(points):
+    points = np.array(points)
     n = len(points) - 1
-    return lambda t: sum([
-        ((1 - t)**(n - k)) * (t**k) * choose_using_cache(n, k) * point
-        for k, point in enumerate(points)
+    powers = np.arange(n + 1)
+    binomials = np.array([choose_using_cache(n, k) for k in powers])
+
+    def result(t):
+        # Bernstein weights for each point, along the last axis
+        t = np.expand_dims(t, -1)
+        weights = binomials * ((1 - t)**(n - powers)) * (t**powers)
+        value = np.tensordot(weights, points, axes=([-1], [0]))
+        if value.ndim == 0:
+            return value[()]
+        return value
+    return result
+
+
+@lru_cache(maxsize=None)
+def get_binomial_table(n):
+    # table[m, k] is m choose k, or 0 for k > m
+    table = np.array([
+        [choose_using_cache(m, k) for k in range(n + 1)]
+        for m in range(n + 1)
     ])
+    table.flags.writeable = False
+    return table
+
+
+def get_partial_bezier_matrices(n, a_values, b_values):
+    """
+    For each pair a, b, the matrix taking the n + 1 points of a
+    bezier curve of degree n to those of its portion on [a, b],
+    as an array of shape (len(a_values), n + 1, n + 1).
+
+    These are the two rounds of partial_bezier_points written as
+    matrices: the first takes the curve to its portion on [a, 1],
+    the second takes that to its portion on [0, (b - a) / (1 - a)].
+    """
+    a = np.array(a_values, dtype='float').reshape((-1, 1, 1))
+    b = np.array(b_values, dtype='float').reshape((-1, 1, 1))
+    t = (b - a) / (1. - a)
+    binomials = get_binomial_table(n)
+    rows = np.arange(n + 1).reshape((n + 1, 1))
+    cols = np.arange(n + 1).reshape((1, n + 1))
+    # First round, point i becomes bezier(points[i:])(a)
+    ks = np.clip(cols - rows, 0, n)
+    a_to_1 = binomials[n - rows, ks] * ((1 - a)**(n - cols)) * (a**ks)
+    a_to_1 *= (cols >= rows)
+    # Second round, point i becomes bezier(a_to_1[:i + 1])(t)
+    ks = np.clip(rows - cols, 0, n)
+    zero_to_t = binomials[rows, cols] * ((1 - t)**ks) * (t**cols)
+    zero_to_t *= (cols <= rows)
+    return np.matmul(zero_to_t, a_to_1)
 
 
 def partial_bezier_points(points, a, b):
@@ -22,17 +72,23 @@ def partial_bezier_points(points, a, b):
     return an array of the same size, which
     describes the portion of the original bezier
     curve on the interval [a, b].
+    """
+    points = np.array(points)
+    matrix = get_partial_bezier_matrices(len(points) - 1, [a], [b])[0]
+    return np.dot(matrix, points)
 
-    This algorithm is pretty nifty, and pretty dense.
+
+def partial_bezier_points_of_curves(curves, a_values, b_values):
     """
-    a_to_1 = np.array([
-        bezier(points[i:])(a)
-        for i in range(len(points))
-    ])
-    return np.array([
-        bezier(a_to_1[:i + 1])((b - a) / (1. - a))
-        for i in range(len(points))
-    ])
+    Same as partial_bezier_points, but for many curves at once.
+    curves has shape (num_curves, n + 1, dim), and a_values and
+    b_values each have one number per curve.
+    """
+    curves = np.array(curves)
+    matrices = get_partial_bezier_matrices(
+        curves.shape[1] - 1, a_values, b_values
+    )
+    return np.matmul(matrices, curves)
 
 
 # Linear interpolation variants
@@ -0,0 +1,112 @@
+import functools
+import hashlib
+import numpy as np
+import types
+
+from colour import Color
+
+# Floats are rounded to this many decimal places before hashing, so
+# that the same state reached by different sequences of operations,
+# e.g. many small shifts versus one large one, hashes the same
+FLOAT_HASH_PRECISION = 6
+
+
+def get_hash_from_objects(*objects, **kwargs):
+    """
+    Digest of the full state of the given objects, following
+    attributes, containers and the code and closures of functions,
+    so that two runs building the same objects give the same hash.
+    Anything whose state can't be seen this way (e.g. an object whose
+    repr includes its memory address) just makes the hash change from
+    one run to the next, which errs on the side of a cache miss.
+
+    Objects passed as ignored_objects only contribute a placeholder
+    wherever they are reached.
+    """
+    hasher = hashlib.sha256()
+    memo = {}
+    for obj in kwargs.get("ignored_objects", []):
+        memo[id(obj)] = (len(memo), obj)
+    for obj in objects:
+        update_hasher_with_object(hasher, obj, memo)
+    return hasher.hexdigest()[:32]
+
+
+def update_hasher_with_object(hasher, obj, memo):
+    def update(string):
+        hasher.update(string.encode())
+
+    if isinstance(obj, float):
+        # Adding 0.0 turns -0.0 into 0.0
+        update(repr(round(obj, FLOAT_HASH_PRECISION) + 0.0))
+        return
+    if obj is None or isinstance(obj, (bool, int, complex, str)):
+        update(repr(obj))
+        return
+    if isinstance(obj, bytes):
+        hasher.update(obj)
+        return
+    if isinstance(obj, Color):
+        update("Color" + obj.get_hex_l())
+        return
+    if isinstance(obj, np.generic):
+        update_hasher_with_object(hasher, obj.item(), memo)
+        return
+    # Everything past here might be referred to more than
+    # once, or refer back to itself
+    if id(obj) in memo:
+        update("<ref %d>" % memo[id(obj)][0])
+        return
+    # Holding onto obj keeps its id from being reused while hashing
+    memo[id(obj)] = (len(memo), obj)
+
+    if isinstance(obj, np.ndarray):
+        update("ndarray%s%s" % (obj.dtype.str, obj.shape))
+        if np.issubdtype(obj.dtype, np.floating):
+            obj = np.round(obj, FLOAT_HASH_PRECISION) + 0.0
+        hasher.update(np.ascontiguousarray(obj).data)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        items = obj
+        if isinstance(obj, (set, frozenset)):
+            items = sorted(obj, key=repr)
+        update("%s%d" % (type(obj).__name__, len(items)))
+        for item in items:
+            update_hasher_with_object(hasher, item, memo)
+    elif isinstance(obj, dict):
+        update("dict%d" % len(obj))
+        for key in sorted(obj.keys(), key=repr):
+            update_hasher_with_object(hasher, key, memo)
+            update_hasher_with_object(hasher, obj[key], memo)
+    elif isinstance(obj, types.MethodType):
+        update("method")
+        update_hasher_with_object(hasher, obj.__func__, memo)
+        update_hasher_with_object(hasher, obj.__self__, memo)
+    elif isinstance(obj, types.FunctionType):
+        update("function" + obj.__qualname__)
+        update_hasher_with_object(hasher, obj.__code__, memo)
+        update_hasher_with_object(hasher, obj.__defaults__, memo)
+        for cell in obj.__closure__ or []:
+            try:
+                contents = cell.cell_contents
+            except ValueError:
+                # Cell which has not been filled in yet
+                contents = None
+            update_hasher_with_object(hasher, contents, memo)
+    elif isinstance(obj, functools.partial):
+        update("partial")
+        update_hasher_with_object(hasher, obj.func, memo)
+        update_hasher_with_object(hasher, obj.args, memo)
+        update_hasher_with_object(hasher, obj.keywords, memo)
+    elif isinstance(obj, types.CodeType):
+        hasher.update(obj.co_code)
+        update_hasher_with_object(hasher, obj.co_consts, memo)
+        update_hasher_with_object(hasher, obj.co_names, memo)
+    elif isinstance(obj, (type, types.BuiltinFunctionType, types.ModuleType)):
+        update(getattr(obj, "__qualname__", obj.__name__))
+    elif hasattr(obj, "__dict__"):
+        update(type(obj).__qualname__)
+        if type(obj).__repr__ is not object.__repr__:
+            update(repr(obj))
+        update_hasher_with_object(hasher, obj.__dict__, memo)
+    else:
+        update(repr(obj))
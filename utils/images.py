@@ -1,8 +1,17 @@
 import numpy as np
 import os
 
-from PIL import Image
+from collections import OrderedDict
+
 from constants import RASTER_IMAGE_DIR
+from utils.lazy_imports import lazy_import
+
+Image = lazy_import("PIL.Image")
+
+# Decoded raster images shared across the process, least recently
+# used first, see get_raster_image_array
+RASTER_IMAGE_CACHE = OrderedDict()
+RASTER_IMAGE_CACHE_MAX_BYTES = 1024 * 1024 * 1024
 
 
 def get_full_raster_image_path(image_file_name):
@@ -19,6 +28,43 @@ def get_full_raster_image_path(image_file_name):
     raise IOError("File %s not Found" % image_file_name)
 
 
+def get_raster_image_array(image_file_name, mode=None, size=None):
+    """
+    Decodes the image found by get_full_raster_image_path, converted
+    to mode and resized to size, as (width, height), when those are
+    given.
+
+    Results are cached for the whole process, keyed by path, time of
+    last modification, mode and size, so each image is only decoded
+    once however many mobjects and cameras use it.  Once the cache
+    holds more than RASTER_IMAGE_CACHE_MAX_BYTES, the least recently
+    used arrays are dropped.  The arrays returned are shared, and so
+    read-only, and should be copied before being changed.
+    """
+    path = get_full_raster_image_path(image_file_name)
+    stat = os.stat(path)
+    key = (
+        os.path.realpath(path), stat.st_mtime, stat.st_size,
+        mode, None if size is None else tuple(size),
+    )
+    if key in RASTER_IMAGE_CACHE:
+        RASTER_IMAGE_CACHE.move_to_end(key)
+        return RASTER_IMAGE_CACHE[key]
+    image = Image.open(path)
+    if mode is not None:
+        image = image.convert(mode)
+    if size is not None and image.size != tuple(size):
+        image = image.resize(tuple(size))
+    result = np.array(image)
+    result.flags.writeable = False
+    RASTER_IMAGE_CACHE[key] = result
+    total_bytes = sum([array.nbytes for array in RASTER_IMAGE_CACHE.values()])
+    while total_bytes > RASTER_IMAGE_CACHE_MAX_BYTES:
+        old_key, old_array = RASTER_IMAGE_CACHE.popitem(last=False)
+        total_bytes -= old_array.nbytes
+    return result
+
+
 def drag_pixels(frames):
     curr = frames[0]
     new_frames = []
@@ -32,3 +78,30 @@ def invert_image(image):
     arr = np.array(image)
     arr = (255 * np.ones(arr.shape)).astype(arr.dtype) - arr
     return Image.fromarray(arr)
+
+
+def halve_rgba_array(rgba_array):
+    """
+    Averages each 2x2 block of pixels, weighting colors by alpha so
+    that transparent pixels don't darken their neighbors.  An odd
+    last row or column is dropped.
+    """
+    height, width = rgba_array.shape[0] // 2, rgba_array.shape[1] // 2
+    corners = [
+        rgba_array[i:2 * height:2, j:2 * width:2]
+        for i in (0, 1) for j in (0, 1)
+    ]
+    if rgba_array.dtype == np.uint8 and np.all(rgba_array[:, :, 3] == 255):
+        # Opaque, so a plain average, which integers can do faster
+        total = sum([corner.astype('uint16') for corner in corners])
+        return ((total + 2) // 4).astype(rgba_array.dtype)
+    blocks = rgba_array[:2 * height, :2 * width].astype('float32')
+    blocks = blocks.reshape((height, 2, width, 2, 4))
+    alphas = blocks[:, :, :, :, 3:]
+    alpha_sums = alphas.sum(axis=(1, 3))
+    rgbs = (blocks[:, :, :, :, :3] * alphas).sum(axis=(1, 3))
+    rgbs /= np.maximum(alpha_sums, 1e-6)
+    result = np.zeros((height, width, 4), dtype=rgba_array.dtype)
+    result[:, :, :3] = np.round(rgbs)
+    result[:, :, 3:] = np.round(alpha_sums / 4)
+    return result
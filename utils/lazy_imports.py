@@ -0,0 +1,45 @@
+import importlib
+
+
+class LazyModule(object):
+    """
+    Stands in for a module until one of its attributes is first
+    looked up, at which point the module is actually imported.
+
+    Some dependencies, like cv2, scipy and PIL, take a noticeable
+    fraction of a second to import, yet most scenes never touch
+    them.  Binding them at module level with lazy_import, e.g.
+        cv2 = lazy_import("cv2")
+    leaves code using them unchanged, while only scenes which need
+    them pay for the import.
+    """
+
+    def __init__(self, name):
+        self.__dict__["_name"] = name
+        self.__dict__["_module"] = None
+
+    def _load(self):
+        if self._module is None:
+            self.__dict__["_module"] = importlib.import_module(self._name)
+        return self._module
+
+    def is_loaded(self):
+        return self._module is not None
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr, value):
+        setattr(self._load(), attr, value)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        if self._module is None:
+            return "<lazily imported module '%s'>" % self._name
+        return repr(self._module)
+
+
+def lazy_import(name):
+    return LazyModule(name)
@@ -0,0 +1,230 @@
+import csv
+import json
+import time
+
+from collections import OrderedDict
+
+
+class NullStage(object):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+NULL_STAGE = NullStage()
+
+
+class ProfiledStage(object):
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.profiler.stack.append(self.name)
+        self.start_time = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self.start_time
+        self.profiler.add_time(";".join(self.profiler.stack), elapsed)
+        self.profiler.stack.pop()
+        return False
+
+
+class RenderProfiler(object):
+    """
+    Records how long each stage of rendering takes, frame by frame,
+    grouped into segments for each play and wait call.  Stages nest,
+    so a stage is known by the chain of stages it ran within, e.g.
+    "update_frame;capture_mobjects;VMobject;fill", which is what the
+    folded report hands to flame graph tools.
+
+    While disabled, which is the default, stage() hands back a shared
+    do-nothing context manager, so instrumented code costs next to
+    nothing.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.reset()
+
+    def reset(self):
+        self.segments = []
+        self.current_segment = None
+        self.current_frame = None
+        self.stack = []
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.end_segment()
+        self.enabled = False
+
+    def stage(self, name):
+        if not self.enabled:
+            return NULL_STAGE
+        return ProfiledStage(self, name)
+
+    def add_time(self, key, elapsed):
+        if self.current_segment is None:
+            self.begin_segment("Outside play and wait calls")
+        totals = self.current_segment["totals"]
+        totals[key] = totals.get(key, 0) + elapsed
+        if self.current_frame is not None:
+            self.current_frame[key] = self.current_frame.get(key, 0) + elapsed
+
+    def begin_segment(self, name):
+        if not self.enabled:
+            return
+        self.end_segment()
+        self.current_segment = {
+            "name": name,
+            "num_frames": 0,
+            "totals": OrderedDict(),
+            "frames": [],
+        }
+        self.segments.append(self.current_segment)
+
+    def end_segment(self):
+        self.end_frame()
+        self.current_segment = None
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        if self.current_segment is None:
+            self.begin_segment("Outside play and wait calls")
+        self.current_frame = OrderedDict()
+        self.current_segment["frames"].append(self.current_frame)
+        self.current_segment["num_frames"] += 1
+
+    def end_frame(self):
+        self.current_frame = None
+
+    # Reports
+
+    def get_segment_total_time(self, segment):
+        # Only outermost stages, as the rest are counted within them
+        return sum([
+            value
+            for key, value in segment["totals"].items()
+            if ";" not in key
+        ])
+
+    def get_segment_summary(self, segment, index=None):
+        """
+        Lines showing the time in each stage as an indented tree,
+        with its share of the segment's total
+        """
+        total = self.get_segment_total_time(segment)
+        title = segment["name"]
+        if index is not None:
+            title = "%d. %s" % (index, title)
+        lines = ["%s: %d frames, %.3fs" % (
+            title, segment["num_frames"], total
+        )]
+        for key in sorted(segment["totals"].keys()):
+            stages = key.split(";")
+            value = segment["totals"][key]
+            lines.append("%s%-*s %8.3fs %5.1f%%" % (
+                "  " * len(stages),
+                max(40 - 2 * len(stages), 1),
+                stages[-1],
+                value,
+                100 * value / total if total > 0 else 0,
+            ))
+        return lines
+
+    def print_segment_summary(self, segment=None):
+        if segment is None:
+            segment = self.current_segment
+        if segment is None:
+            return
+        index = self.segments.index(segment)
+        print("\n".join(self.get_segment_summary(segment, index)))
+
+    def get_folded_stack_lines(self):
+        """
+        One line per segment and stage, in the collapsed stack format
+        read by flamegraph.pl and speedscope, with times in
+        microseconds.  Times of stages exclude their inner stages.
+        """
+        lines = []
+        for index, segment in enumerate(self.segments):
+            totals = segment["totals"]
+            root = "%d. %s" % (index, segment["name"].replace(";", ","))
+            for key, value in totals.items():
+                own_time = value - sum([
+                    other_value
+                    for other_key, other_value in totals.items()
+                    if other_key.startswith(key + ";") and
+                    other_key.count(";") == key.count(";") + 1
+                ])
+                lines.append("%s;%s %d" % (
+                    root, key, max(int(own_time * 1e6), 0)
+                ))
+        return lines
+
+    def write_json_report(self, file_path):
+        report = [
+            OrderedDict([
+                ("index", index),
+                ("name", segment["name"]),
+                ("num_frames", segment["num_frames"]),
+                ("total_time", self.get_segment_total_time(segment)),
+                ("totals", segment["totals"]),
+                ("frames", segment["frames"]),
+            ])
+            for index, segment in enumerate(self.segments)
+        ]
+        with open(file_path, "w") as fp:
+            json.dump(report, fp, indent=2)
+
+    def write_csv_report(self, file_path):
+        with open(file_path, "w", newline="") as fp:
+            writer = csv.writer(fp)
+            writer.writerow(["segment", "name", "frame", "stage", "seconds"])
+            for index, segment in enumerate(self.segments):
+                for frame_index, frame in enumerate(segment["frames"]):
+                    for key, value in frame.items():
+                        writer.writerow([
+                            index, segment["name"], frame_index, key, value
+                        ])
+                # Time outside of any frame, e.g. finding the moving
+                # mobjects at the start of a play call
+                outside_frames = OrderedDict(segment["totals"])
+                for frame in segment["frames"]:
+                    for key, value in frame.items():
+                        outside_frames[key] -= value
+                for key, value in outside_frames.items():
+                    if value > 0:
+                        writer.writerow([
+                            index, segment["name"], "", key, value
+                        ])
+
+    def write_folded_report(self, file_path):
+        with open(file_path, "w") as fp:
+            fp.write("\n".join(self.get_folded_stack_lines()) + "\n")
+
+    def write_reports(self, file_path_root):
+        """
+        Writes file_path_root with .json, .csv and .folded extensions,
+        returning the paths written
+        """
+        file_paths = []
+        for extension, writer in [
+            (".json", self.write_json_report),
+            (".csv", self.write_csv_report),
+            (".folded", self.write_folded_report),
+        ]:
+            writer(file_path_root + extension)
+            file_paths.append(file_path_root + extension)
+        return file_paths
+
+
+# Shared by the scene, camera and frame sinks, which is what lets
+# their stages nest within one another
+PROFILER = RenderProfiler()
@@ -1,6 +1,8 @@
 
+import glob
 import os
 import hashlib
+import re
 
 from constants import TEX_DIR
 from constants import TEX_TEXT_TO_REPLACE
@@ -15,12 +17,134 @@ def tex_hash(expression, template_tex_file_body):
     return hasher.hexdigest()[:16]
 
 
+def get_tex_svg_file_path(expression, template_tex_file_body):
+    return os.path.join(
+        TEX_DIR,
+        tex_hash(expression, template_tex_file_body)
+    ) + ".svg"
+
+
 def tex_to_svg_file(expression, template_tex_file_body):
+    result = get_tex_svg_file_path(expression, template_tex_file_body)
+    if os.path.exists(result):
+        return result
     tex_file = generate_tex_file(expression, template_tex_file_body)
     dvi_file = tex_to_dvi(tex_file)
     return dvi_to_svg(dvi_file)
 
 
+def tex_to_svg_files(tex_file_args):
+    """
+    Takes a list of (expression, template_tex_file_body) pairs and
+    returns the list of svg files tex_to_svg_file would give for each.
+    Those expressions with no svg yet are compiled together, as pages
+    of one document per template, so that it takes one run of latex
+    and of dvisvgm rather than one per expression.
+    """
+    pending = dict()
+    for expression, template_tex_file_body in tex_file_args:
+        svg_file = get_tex_svg_file_path(expression, template_tex_file_body)
+        if os.path.exists(svg_file):
+            continue
+        expressions = pending.setdefault(template_tex_file_body, [])
+        if expression not in expressions:
+            expressions.append(expression)
+    for template_tex_file_body, expressions in pending.items():
+        if len(expressions) > 1:
+            try:
+                compile_tex_batch(expressions, template_tex_file_body)
+            except Exception:
+                # Whatever didn't make it gets compiled on its own
+                # below, which also gives a more specific error
+                pass
+    return [
+        tex_to_svg_file(expression, template_tex_file_body)
+        for expression, template_tex_file_body in tex_file_args
+    ]
+
+
+def compile_tex_batch(expressions, template_tex_file_body):
+    body = generate_multi_page_tex_body(expressions, template_tex_file_body)
+    if body is None:
+        return
+    batch_name = "batch_" + tex_hash(
+        "\n".join(expressions), template_tex_file_body
+    )
+    tex_file = os.path.join(TEX_DIR, batch_name) + ".tex"
+    write_file_atomically(tex_file, body)
+    print("Compiling %d tex expressions together in %s" % (
+        len(expressions), tex_file
+    ))
+    dvi_file = tex_to_dvi(tex_file)
+    # Pages are written under a name of this process's own, so that
+    # another process compiling the same batch can't mix in its pages
+    page_root = batch_name + ".%d" % os.getpid()
+    page_pattern = os.path.join(TEX_DIR, page_root + "-%p.svg")
+    commands = [
+        "dvisvgm",
+        dvi_file,
+        "--page=1-",
+        "-n",
+        "-v",
+        "0",
+        "-o",
+        page_pattern,
+        ">",
+        get_null()
+    ]
+    os.system(" ".join(commands))
+    # dvisvgm may pad page numbers with zeros
+    page_files = dict()
+    for page_file in glob.glob(os.path.join(TEX_DIR, page_root + "-*.svg")):
+        page = page_file[:-len(".svg")].split("-")[-1]
+        if page.isdigit():
+            page_files[int(page)] = page_file
+    if sorted(page_files.keys()) != list(range(1, len(expressions) + 1)):
+        # Pages didn't come out one per expression
+        for page_file in page_files.values():
+            os.remove(page_file)
+        return
+    for page, expression in enumerate(expressions, 1):
+        os.replace(
+            page_files[page],
+            get_tex_svg_file_path(expression, template_tex_file_body)
+        )
+
+
+def generate_multi_page_tex_body(expressions, template_tex_file_body):
+    """
+    Puts each expression on its own page using the multi option of
+    the standalone class, which the templates use.  Returns None for
+    templates not built that way.
+    """
+    begin = "\\begin{document}"
+    end = "\\end{document}"
+    if template_tex_file_body.count(begin) != 1:
+        return None
+    preamble, document = template_tex_file_body.split(begin)
+    if end not in document:
+        return None
+    page_body = document[:document.rindex(end)]
+    match = re.search(
+        r"\\documentclass(\[([^\]]*)\])?\{standalone\}", preamble
+    )
+    if match is None:
+        return None
+    options = [o for o in [match.group(2), "multi=true"] if o]
+    preamble = "".join([
+        preamble[:match.start()],
+        "\\documentclass[%s]{standalone}" % ",".join(options),
+        preamble[match.end():],
+    ])
+    pages = [
+        "\\begin{standalone}%s\\end{standalone}\n" % (
+            page_body.replace(TEX_TEXT_TO_REPLACE, expression)
+        )
+        for expression in expressions
+    ]
+    return preamble + begin + "\n" + "".join(pages) + end + "\n"
+
+
 def generate_tex_file(expression, template_tex_file_body):
     result = os.path.join(
         TEX_DIR,
@@ -33,11 +157,28 @@ def generate_tex_file(expression, template_tex_file_body):
         new_body = template_tex_file_body.replace(
             TEX_TEXT_TO_REPLACE, expression
         )
-        with open(result, "w") as outfile:
-            outfile.write(new_body)
+        write_file_atomically(result, new_body)
     return result
 
 
+def get_temp_file_root(file_path):
+    """
+    Several processes may share TEX_DIR, e.g. with the --jobs option
+    of extract_scene, so files there are written under a name unique
+    to this process and moved into place once complete.  That way no
+    process ever reads another's half written file.
+    """
+    root, extension = os.path.splitext(file_path)
+    return "%s.%d.tmp" % (root, os.getpid())
+
+
+def write_file_atomically(file_path, body):
+    temp_file_path = get_temp_file_root(file_path) + ".tex"
+    with open(temp_file_path, "w") as outfile:
+        outfile.write(body)
+    os.replace(temp_file_path, file_path)
+
+
 def get_null():
     if os.name == "nt":
         return "NUL"
@@ -45,13 +186,17 @@ def get_null():
 
 
 def tex_to_dvi(tex_file):
-    result = tex_file.replace(".tex", ".dvi" if not TEX_USE_CTEX else ".xdv")
+    extension = ".dvi" if not TEX_USE_CTEX else ".xdv"
+    result = tex_file.replace(".tex", extension)
     if not os.path.exists(result):
+        temp_root = get_temp_file_root(tex_file)
+        job_name = os.path.basename(temp_root)
         commands = [
             "latex",
             "-interaction=batchmode",
             "-halt-on-error",
             "-output-directory=" + TEX_DIR,
+            "-jobname=" + job_name,
             tex_file,
             ">",
             get_null()
@@ -61,13 +206,20 @@ def tex_to_dvi(tex_file):
             "-interaction=batchmode",
             "-halt-on-error",
             "-output-directory=" + TEX_DIR,
+            "-jobname=" + job_name,
             tex_file,
             ">",
             get_null()
         ]
         exit_code = os.system(" ".join(commands))
-        if exit_code != 0:
-            log_file = tex_file.replace(".tex", ".log")
+        log_file = tex_file.replace(".tex", ".log")
+        if os.path.exists(temp_root + ".log"):
+            os.replace(temp_root + ".log", log_file)
+        if os.path.exists(temp_root + ".aux"):
+            os.remove(temp_root + ".aux")
+        if exit_code == 0 and os.path.exists(temp_root + extension):
+            os.replace(temp_root + extension, result)
+        else:
             raise Exception(
                 ("Latex error converting to dvi. " if not TEX_USE_CTEX
                 else "Xelatex error converting to xdv. ") +
@@ -84,6 +236,7 @@ def dvi_to_svg(dvi_file, regen_if_exists=False):
     """
     result = dvi_file.replace(".dvi" if not TEX_USE_CTEX else ".xdv", ".svg")
     if not os.path.exists(result):
+        temp_file_path = get_temp_file_root(result) + ".svg"
         commands = [
             "dvisvgm",
             dvi_file,
@@ -91,9 +244,11 @@ def dvi_to_svg(dvi_file, regen_if_exists=False):
             "-v",
             "0",
             "-o",
-            result,
+            temp_file_path,
             ">",
             get_null()
         ]
         os.system(" ".join(commands))
+        if os.path.exists(temp_file_path):
+            os.replace(temp_file_path, result)
     return result